@@ -0,0 +1,105 @@
+"""Test the streaming multipart request body for notebook file uploads."""
+
+import os
+import requests
+import shutil
+import tempfile
+import unittest
+
+from vizier.api.client.resources.notebook import MultipartFileReader
+
+
+FILE_CONTENT = b'Name,Age\nAlice,23\nBob,32\n' * 100
+
+
+class TestMultipartFileReader(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary file for upload."""
+        self.base_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.base_dir, 'people.csv')
+        with open(self.filename, 'wb') as f:
+            f.write(FILE_CONTENT)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.base_dir)
+
+    def get_expected_body(self, boundary):
+        """Get the request body and headers that requests generates for the
+        upload of the temporary file via files=. The random boundary is
+        replaced by the given boundary.
+        """
+        with open(self.filename, 'rb') as f:
+            req = requests.Request(
+                'POST',
+                'http://localhost/files',
+                files={'file': f}
+            ).prepare()
+        content_type = req.headers['Content-Type']
+        prefix, req_boundary = content_type.split('boundary=')
+        body = req.body.replace(
+            req_boundary.encode('utf-8'),
+            boundary.encode('utf-8')
+        )
+        return prefix + 'boundary=' + boundary, body
+
+    def test_request_body(self):
+        """Test that the reader produces the same body as requests."""
+        with open(self.filename, 'rb') as f:
+            reader = MultipartFileReader(
+                fileobj=f,
+                filename=os.path.basename(self.filename)
+            )
+            boundary = reader.content_type.split('boundary=')[1]
+            content_type, body = self.get_expected_body(boundary)
+            self.assertEqual(reader.content_type, content_type)
+            self.assertEqual(len(reader), len(body))
+            self.assertEqual(reader.read(), body)
+            # The body is exhausted after the read
+            self.assertEqual(reader.read(), b'')
+        self.assertTrue(body.startswith(b'--' + boundary.encode('utf-8')))
+        self.assertTrue(body.endswith(
+            b'\r\n--' + boundary.encode('utf-8') + b'--\r\n'
+        ))
+        self.assertIn(FILE_CONTENT, body)
+
+    def test_chunked_read(self):
+        """Test reading the body in chunks that span the part boundaries."""
+        with open(self.filename, 'rb') as f:
+            reader = MultipartFileReader(
+                fileobj=f,
+                filename=os.path.basename(self.filename)
+            )
+            boundary = reader.content_type.split('boundary=')[1]
+            _, body = self.get_expected_body(boundary)
+            chunks = list()
+            while True:
+                chunk = reader.read(37)
+                if not chunk:
+                    break
+                self.assertLessEqual(len(chunk), 37)
+                chunks.append(chunk)
+        self.assertEqual(b''.join(chunks), body)
+
+    def test_prepared_request(self):
+        """Test the Content-Length that requests reports for the reader."""
+        with open(self.filename, 'rb') as f:
+            reader = MultipartFileReader(
+                fileobj=f,
+                filename=os.path.basename(self.filename)
+            )
+            boundary = reader.content_type.split('boundary=')[1]
+            _, body = self.get_expected_body(boundary)
+            req = requests.Request(
+                'POST',
+                'http://localhost/files',
+                data=reader,
+                headers={'Content-Type': reader.content_type}
+            ).prepare()
+            self.assertEqual(req.headers['Content-Length'], str(len(body)))
+            self.assertNotIn('Transfer-Encoding', req.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,24 @@
 
 import unittest
 
-from vizier.api.routes.base import UrlFactory
+from vizier.api.routes.base import UrlFactory, URL_TEMPLATES
 from vizier.api.routes.base import PROPERTIES_BASEURL, PROPERTIES_APIDOCURL
+from vizier.api.routes.container import ContainerApiUrlFactory
+from vizier.api.routes.container import ContainerEngineUrlFactory
 from vizier.api.routes.task import TaskUrlFactory
 
 
+class ContainerProjects(object):
+    """Project cache for the container engine url factory that maintains a
+    single project container.
+    """
+    def __init__(self, urls):
+        self.urls = urls
+
+    def get_project(self, project_id):
+        return self
+
+
 class TestUrlFactoryInit(unittest.TestCase):
 
     def test_init_url_factory(self):
@@ -47,6 +60,93 @@ class TestUrlFactoryInit(unittest.TestCase):
                 properties={PROPERTIES_APIDOCURL: 'XYZ'}
             )
 
+    def test_url_cache(self):
+        """Test that memoized route urls are identical to the generated urls."""
+        urls = UrlFactory(base_url='http://abc.com/')
+        url = urls.get_workflow_module('P', 'B', 'M')
+        self.assertEqual(url, 'http://abc.com/projects/P/branches/B/head/modules/M')
+        self.assertIn(('get_workflow_module', 'P', 'B', 'M'), urls.url_cache)
+        self.assertEqual(urls.get_workflow_module('P', 'B', 'M'), url)
+        self.assertEqual(
+            urls.get_dataset('P', 'D', force_profiler=True),
+            'http://abc.com/projects/P/datasets/D?profile=true'
+        )
+        self.assertEqual(
+            urls.get_dataset('P', 'D'),
+            'http://abc.com/projects/P/datasets/D'
+        )
+
+    def test_url_templates(self):
+        """Test that the route methods return the urls from the templates."""
+        urls = UrlFactory(base_url='http://abc.com/')
+        self.assertEqual(urls.list_projects(), 'http://abc.com/projects')
+        self.assertEqual(
+            urls.get_chart_view('P', 'B', 'W', 'M', 'C'),
+            'http://abc.com/projects/P/branches/B/workflows/W/modules/M/charts/C'
+        )
+        self.assertEqual(
+            urls.url_for('get_chart_view', project_id='P', branch_id='B', workflow_id='W', module_id='M', chart_id='C'),
+            'http://abc.com/projects/P/branches/B/workflows/W/modules/M/charts/C'
+        )
+        self.assertEqual(
+            urls.download_file('P', 'F'),
+            'http://abc.com/projects/P/files/F'
+        )
+        # The project container API serves datasets and files directly
+        container = ContainerApiUrlFactory(base_url='http://xyz.com/')
+        self.assertEqual(
+            container.get_branch('P', 'B'),
+            'http://xyz.com/projects/P/branches/B'
+        )
+        self.assertEqual(
+            container.get_dataset('P', 'D', force_profiler=True),
+            'http://xyz.com/datasets/D?profile=true'
+        )
+        self.assertEqual(
+            container.get_dataset_descriptor('P', 'D'),
+            'http://xyz.com/datasets/D/descriptor'
+        )
+        self.assertEqual(container.upload_file('P'), 'http://xyz.com/files')
+        self.assertEqual(
+            container.url_for('download_file', project_id='P', file_id='F'),
+            'http://xyz.com/files/F'
+        )
+        # The container engine delegates dataset and file routes to the url
+        # factory of the project container
+        engine = ContainerEngineUrlFactory(
+            base_url='http://abc.com/',
+            projects=ContainerProjects(container)
+        )
+        self.assertEqual(
+            engine.get_branch('P', 'B'),
+            'http://abc.com/projects/P/branches/B'
+        )
+        for name, args in [
+            ('get_dataset', {'dataset_id': 'D'}),
+            ('download_dataset', {'dataset_id': 'D'}),
+            ('get_dataset_descriptor', {'dataset_id': 'D'}),
+            ('upload_file', {}),
+            ('download_file', {'file_id': 'F'})
+        ]:
+            self.assertIn(name, URL_TEMPLATES)
+            self.assertEqual(
+                engine.url_for(name, project_id='P', **args),
+                container.url_for(name, project_id='P', **args)
+            )
+            self.assertEqual(
+                getattr(engine, name)(project_id='P', **args),
+                container.url_for(name, project_id='P', **args)
+            )
+        # Routes with query arguments are created by the factory methods
+        self.assertEqual(
+            urls.url_for('dataset_pagination', project_id='P', dataset_id='D', limit=10),
+            'http://abc.com/projects/P/datasets/D?offset=0&limit=10'
+        )
+        # Only route names are accepted
+        for name in ['unknown_route', 'cache_url', 'url_for']:
+            with self.assertRaises(ValueError):
+                urls.url_for(name)
+
     def test_tasks_url_factory(self):
         """Initialize the task url factory."""
         fact = TaskUrlFactory(base_url='http://abc.com/////')
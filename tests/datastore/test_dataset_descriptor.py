@@ -87,6 +87,44 @@ class TestDatasetDescriptor(unittest.TestCase):
         self.assertEqual(ds.get_index(3), 2)
         self.assertEqual(ds.get_index(4), 0)
 
+    def test_column_index_after_schema_change(self):
+        """Test that column lookups reflect changes to the list of columns."""
+        ds = DatasetDescriptor(
+            identifier='0',
+            name='0',
+            columns=[
+                DatasetColumn(identifier=0, name='ABC'),
+                DatasetColumn(identifier=1, name='DEF')
+            ]
+        )
+        self.assertEqual(ds.column_by_id(1).name, 'DEF')
+        self.assertEqual(ds.column_by_name('def').identifier, 1)
+        self.assertIsNone(ds.column_by_name('XYZ'))
+        ds.columns.insert(0, DatasetColumn(identifier=2, name='XYZ'))
+        self.assertEqual(ds.column_by_id(1).name, 'DEF')
+        self.assertEqual(ds.get_index(1), 2)
+        self.assertEqual(ds.column_by_name('xyz').identifier, 2)
+        self.assertEqual(ds.column_by_name('DEF').identifier, 1)
+        del ds.columns[2]
+        self.assertIsNone(ds.get_index(1))
+        self.assertIsNone(ds.column_by_name('DEF'))
+        # Renaming an earlier column in place to a matching name makes it the
+        # first match
+        ds = DatasetDescriptor(
+            identifier='0',
+            name='0',
+            columns=[
+                DatasetColumn(identifier=0, name='a'),
+                DatasetColumn(identifier=1, name='B')
+            ]
+        )
+        self.assertEqual(ds.column_by_name('b').identifier, 1)
+        ds.columns[0].name = 'b'
+        self.assertEqual(ds.column_by_name('b').identifier, 0)
+        self.assertIsNone(ds.column_by_name('a'))
+        ds.columns[0] = DatasetColumn(identifier=2, name='B')
+        self.assertEqual(ds.column_by_name('b').identifier, 2)
+
     def test_unique_name(self):
         """Test method that computes unique column names."""
         ds = DatasetDescriptor(
@@ -71,6 +71,24 @@ class TestDatasetReader(unittest.TestCase):
         self.assertEqual(count, len(rows))
         os.remove(tmp_file)
 
+    def test_default_json_reader_range(self):
+        """Test reading a range of rows from a Json dataset file."""
+        tmp_file = tempfile.mkstemp()[1]
+        reader = DefaultJsonDatasetReader(tmp_file)
+        rows = [DatasetRow(i, ['A', i, 1.5]) for i in range(5)]
+        # Include a NaN value that the streaming parser cannot read
+        rows.append(DatasetRow(5, ['A', 5, float('nan')]))
+        reader.write(rows)
+        with DefaultJsonDatasetReader(tmp_file, offset=1, limit=2) as r:
+            self.assertEqual([row.identifier for row in r], [1, 2])
+        with DefaultJsonDatasetReader(tmp_file, offset=4) as r:
+            self.assertEqual([row.identifier for row in r], [4, 5])
+        with DefaultJsonDatasetReader(tmp_file, limit=-1) as r:
+            self.assertEqual(len(list(r)), len(rows))
+        with DefaultJsonDatasetReader(tmp_file) as r:
+            self.assertEqual(next(r).values, ['A', 0, 1.5])
+        os.remove(tmp_file)
+
     def read_dataset(self, reader):
         """The reader should contain three rows with three values each."""
         count = 0
@@ -0,0 +1,105 @@
+"""Test the index of exportable symbols in a Python cell source."""
+
+import ast
+import unittest
+
+from vizier.engine.packages.pycell.client.base import SymbolIndex
+
+
+SOURCE = """
+import math
+
+def area(r):
+    inner = 2
+    return math.pi * r * r
+
+class Circle(object):
+    radius = 1
+
+count = 5
+name = 'circle'
+points = [area(1), area(2)]
+
+if count > 1:
+    def perimeter(r):
+        return 2 * math.pi * r
+
+count = 6
+
+a, b = 1, 2
+obj = Circle()
+obj.radius = 3
+"""
+
+
+class TestSymbolIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Build the symbol index for the test source."""
+        self.index = SymbolIndex(ast.parse(SOURCE))
+
+    def assertSource(self, source, expected):
+        """Compare the syntax trees of the generated and the expected source
+        since the unparser may differ in formatting.
+        """
+        self.assertEqual(
+            ast.dump(ast.parse(source)),
+            ast.dump(ast.parse(expected))
+        )
+
+    def test_definitions(self):
+        """Test source for exported functions and classes."""
+        self.assertSource(
+            self.index.get_source('area'),
+            '@vizierdb.export_module_decorator\n'
+            'def area(r):\n'
+            '    inner = 2\n'
+            '    return math.pi * r * r\n'
+        )
+        self.assertSource(
+            self.index.get_source('Circle'),
+            '@vizierdb.export_module_decorator\n'
+            'class Circle(object):\n'
+            '    radius = 1\n'
+        )
+        # Definitions in nested blocks are indexed
+        self.assertSource(
+            self.index.get_source('perimeter'),
+            '@vizierdb.export_module_decorator\n'
+            'def perimeter(r):\n'
+            '    return 2 * math.pi * r\n'
+        )
+        # Function bodies are not scanned
+        self.assertEqual(self.index.get_source('inner'), '')
+
+    def test_variables(self):
+        """Test source for exported variables."""
+        # Literals are emitted as is
+        self.assertEqual(
+            self.index.get_source('name'),
+            "name = vizierdb.wrap_variable('circle', 'name')"
+        )
+        self.assertSource(
+            self.index.get_source('points'),
+            "points = vizierdb.wrap_variable([area(1), area(2)], 'points')"
+        )
+        # The last definition of a name wins
+        self.assertEqual(
+            self.index.get_source('count'),
+            "count = vizierdb.wrap_variable(6, 'count')"
+        )
+
+    def test_unsupported_targets(self):
+        """Test that tuple and attribute assignments are not indexed."""
+        self.assertEqual(self.index.get_source('a'), '')
+        self.assertEqual(self.index.get_source('b'), '')
+        self.assertEqual(self.index.get_source('radius'), '')
+        self.assertSource(
+            self.index.get_source('obj'),
+            "obj = vizierdb.wrap_variable(Circle(), 'obj')"
+        )
+        self.assertEqual(self.index.get_source('unknown'), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@ import unittest
 
 from vizier.datastore.fs.base import FileSystemDatastore
 from vizier.engine.packages.pycell.client.base import VizierDBClient
-from vizier.engine.packages.pycell.client.dataset import DatasetClient
+from vizier.engine.packages.pycell.client.dataset import DatasetClient, ROW_PAGE_SIZE
 from vizier.filestore.fs.base import FileSystemFilestore
 
 
@@ -35,6 +35,50 @@ class TestVizierClient(unittest.TestCase):
         if os.path.isdir(SERVER_DIR):
             shutil.rmtree(SERVER_DIR)
 
+    def test_to_bokeh(self):
+        """Test converting a dataset into a bokeh data source."""
+        ds = DatasetClient()
+        ds.insert_column('Name')
+        ds.insert_column('Age')
+        ds.insert_column('City')
+        ds.insert_row(['Alice', '23', 'Buffalo'])
+        ds.insert_row(['Bob', '25', 'Chicago'])
+        self.assertEqual(
+            ds.to_bokeh().data,
+            {
+                'Name': ['Alice', 'Bob'],
+                'Age': ['23', '25'],
+                'City': ['Buffalo', 'Chicago']
+            }
+        )
+        self.assertEqual(
+            ds.to_bokeh(columns=['City', 0]).data,
+            {'City': ['Buffalo', 'Chicago'], 'Name': ['Alice', 'Bob']}
+        )
+        # Column identifiers no longer match column positions after columns
+        # are deleted or moved
+        ds = VizierDBClient(
+            datastore=self.datastore,
+            datasets=dict(),
+            dataobjects=dict(),
+            source="",
+            project_id=7
+        ).create_dataset('people', ds)
+        ds.delete_column('Name')
+        ds.move_column('City', 0)
+        self.assertEqual(
+            [col.identifier for col in ds.columns],
+            [2, 1]
+        )
+        self.assertEqual(
+            ds.to_bokeh().data,
+            {'City': ['Buffalo', 'Chicago'], 'Age': ['23', '25']}
+        )
+        self.assertEqual(
+            ds.to_bokeh(columns=['age']).data,
+            {'Age': ['23', '25']}
+        )
+
     def test_create_new_dataset(self):
         """Test creating and updating a new dataset via the client."""
         client = VizierDBClient(
@@ -83,6 +127,92 @@ class TestVizierClient(unittest.TestCase):
         self.assertTrue('thisisnotadataset' in client.read)
         self.assertFalse('thisisnotadataset' in client.write)
 
+    def test_column_index(self):
+        """Test resolving column names after the schema was modified."""
+        ds = DatasetClient()
+        ds.insert_column('Name')
+        ds.insert_column('Age')
+        ds.insert_row(['Alice', '23'])
+        self.assertEqual(ds.column_index('age'), 1)
+        self.assertEqual(ds.rows[0].get_value('Age'), '23')
+        ds.move_column('Age', 0)
+        self.assertEqual(ds.column_index('Age'), 0)
+        self.assertEqual(ds.column_index('name'), 1)
+        ds.insert_column('City', position=0)
+        self.assertEqual(ds.column_index('Name'), 2)
+        ds.columns[2].name = 'First'
+        self.assertEqual(ds.column_index('first'), 2)
+        with self.assertRaises(ValueError):
+            ds.column_index('Name')
+        ds.insert_column('Age')
+        with self.assertRaises(ValueError):
+            ds.column_index('Age')
+        ds.delete_column('City')
+        self.assertEqual(ds.column_index('A'), 0)
+        self.assertEqual(ds.rows[0].get_value('first'), 'Alice')
+        # Renaming a column in place to an existing name makes the name
+        # ambiguous
+        ds = DatasetClient()
+        ds.insert_column('Name')
+        ds.insert_column('Age')
+        self.assertEqual(ds.column_index('name'), 0)
+        ds.columns[1].name = 'NAME'
+        with self.assertRaises(ValueError):
+            ds.column_index('name')
+
+    def test_get_cell(self):
+        """Test reading individual cells with and without loaded rows."""
+        ds = self.datastore.load_dataset(self.filestore.upload_file(CSV_FILE))
+        client = VizierDBClient(
+            datastore=self.datastore,
+            datasets={DATASET_NAME:ds},
+            dataobjects=dict(),
+            source="",
+            project_id=7
+        )
+        ds = client.get_dataset(DATASET_NAME)
+        name = ds.get_cell('Name', 1)
+        age = ds.get_cell(1, 1)
+        self.assertEqual(name, 'Bob')
+        with self.assertRaises(ValueError):
+            ds.get_cell('Name', 2)
+        self.assertEqual(ds.rows[1].get_value('Name'), name)
+        self.assertEqual(ds.rows[1].get_value(1), age)
+        self.assertEqual(ds.get_cell('Name', 1), name)
+        with self.assertRaises(ValueError):
+            ds.get_cell('Name', 2)
+
+    def test_get_cell_fetches_pages(self):
+        """Test that reading cells fetches each page of rows only once."""
+        ds = self.datastore.load_dataset(self.filestore.upload_file(CSV_FILE))
+        client = VizierDBClient(
+            datastore=self.datastore,
+            datasets={DATASET_NAME:ds},
+            dataobjects=dict(),
+            source="",
+            project_id=7
+        )
+        ds = client.get_dataset(DATASET_NAME)
+        fetch_rows = ds.dataset.fetch_rows
+        requests = list()
+        def counting_fetch_rows(offset=0, limit=None):
+            requests.append((offset, limit))
+            return fetch_rows(offset=offset, limit=limit)
+        ds.dataset.fetch_rows = counting_fetch_rows
+        values = [
+            ds.get_cell(col, row)
+            for row in range(2)
+            for col in ['Name', 'Age', 'Salary']
+        ]
+        with self.assertRaises(ValueError):
+            ds.get_cell('Name', 2)
+        self.assertEqual(values, ['Alice', 23, '35K', 'Bob', 32, '30K'])
+        self.assertEqual(requests, [(0, ROW_PAGE_SIZE)])
+        # Loading the rows replaces the cached page
+        self.assertEqual(len(ds.rows), 2)
+        self.assertEqual(ds.get_cell('Age', 1), 32)
+        self.assertEqual(requests, [(0, ROW_PAGE_SIZE), (0, None)])
+
     def test_update_existing_dataset(self):
         """Test creating and updating an existing dataset via the client."""
         # Move columns around
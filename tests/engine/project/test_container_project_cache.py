@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import tempfile
 import unittest
 
 from vizier.config.app import AppConfig, DEFAULT_FILESTORES_DIR, DEFAULT_DATASTORES_DIR
@@ -12,30 +13,25 @@ from vizier.viztrail.objectstore.repository import OSViztrailRepository
 from vizier.datastore.mimir.factory import MimirDatastoreFactory
 from vizier.filestore.fs.factory import FileSystemFilestoreFactory
 
-SERVER_DIR = './.tmp'
-VIZTRAILS_DIR = SERVER_DIR + '/vt'
-
 
 class TestContainerCache(unittest.TestCase):
 
     def setUp(self):
         """Create an instance of the default cache with an empty directory
         """
-        if os.path.isdir(SERVER_DIR):
-            shutil.rmtree(SERVER_DIR)
-        os.makedirs(SERVER_DIR)
+        self.server_dir = tempfile.mkdtemp(prefix='viztest-')
+        self.viztrails_dir = os.path.join(self.server_dir, 'vt')
 
     def tearDown(self):
         """Remove the server directory."""
-        if os.path.isdir(SERVER_DIR):
-            shutil.rmtree(SERVER_DIR)
+        shutil.rmtree(self.server_dir, ignore_errors=True)
 
     def test_create_cache(self):
         """Test accessing and deleting projects for an empty repository."""
-        viztrails = OSViztrailRepository(base_path=VIZTRAILS_DIR)
+        viztrails = OSViztrailRepository(base_path=self.viztrails_dir)
         vt1 = viztrails.create_viztrail(properties={PROPERTY_NAME: 'My Project'})
         vt2 = viztrails.create_viztrail(properties={PROPERTY_NAME: 'A Project'})
-        filename = os.path.join(SERVER_DIR, 'container.json')
+        filename = os.path.join(self.server_dir, 'container.json')
         DefaultObjectStore().write_object(
             object_path=filename,
             content=[
@@ -54,9 +50,9 @@ class TestContainerCache(unittest.TestCase):
             ]
         )
         # Initialize the project cache
-        viztrails = OSViztrailRepository(base_path=VIZTRAILS_DIR)
-        filestores_dir = os.path.join(SERVER_DIR, DEFAULT_FILESTORES_DIR)
-        datastores_dir = os.path.join(SERVER_DIR, DEFAULT_DATASTORES_DIR)
+        viztrails = OSViztrailRepository(base_path=self.viztrails_dir)
+        filestores_dir = os.path.join(self.server_dir, DEFAULT_FILESTORES_DIR)
+        datastores_dir = os.path.join(self.server_dir, DEFAULT_DATASTORES_DIR)
         projects = ContainerProjectCache(
             viztrails=viztrails,
             container_file=filename,
@@ -2,8 +2,8 @@
 package.
 """
 
-import os
 import shutil
+import tempfile
 import unittest
 
 from vizier.engine.packages.vizual.command import delete_column, load_dataset
@@ -28,24 +28,29 @@ DATASETS = {
     )
 }
 PACKAGE = pckg.PackageIndex(vizual.VIZUAL_COMMANDS)
+CMD_DEL_COL = PACKAGE.get(vizual.VIZUAL_DEL_COL)
+CMD_PROJECTION = PACKAGE.get(vizual.VIZUAL_PROJECTION)
+CMD_SORT = PACKAGE.get(vizual.VIZUAL_SORT)
+CMD_UPD_CELL = PACKAGE.get(vizual.VIZUAL_UPD_CELL)
 
-SERVER_DIR = './.tmp'
 CSV_FILE = './tests/viztrail/module/.files/dataset.csv'
 
 
 class TestValidateVizual(unittest.TestCase):
 
-    def setUp(self):
-        """Create an empty file server repository."""
-        # Drop project descriptor directory
-        if os.path.isdir(SERVER_DIR):
-            shutil.rmtree(SERVER_DIR)
+    @classmethod
+    def setUpClass(cls):
+        """Create an empty file server directory. The tests only validate
+        commands and do not modify the directory. It is therefore sufficient
+        to create the directory once for all tests.
+        """
+        cls.server_dir = tempfile.mkdtemp(prefix='viztest-')
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean-up by dropping file server directory.
         """
-        if os.path.isdir(SERVER_DIR):
-            shutil.rmtree(SERVER_DIR)
+        shutil.rmtree(cls.server_dir, ignore_errors=True)
 
     def test_delete_column(self):
         """Test validation of delete column command."""
@@ -54,14 +59,14 @@ class TestValidateVizual(unittest.TestCase):
             column=2,
             validate=True
         ).to_external_form(
-            command=PACKAGE.get(vizual.VIZUAL_DEL_COL),
+            command=CMD_DEL_COL,
             datasets=DATASETS
         )
         self.assertEqual(cmd, 'DELETE COLUMN \'Some Name\' FROM ds')
 
 #     def test_load_dataset(self):
 #         """Test validation of load dataset command."""
-#         db = FileSystemFilestore(SERVER_DIR)
+#         db = FileSystemFilestore(self.server_dir)
 #         fh = db.upload_file(CSV_FILE)
 #         cmd = load_dataset(
 #             dataset_name='ds',
@@ -110,7 +115,7 @@ class TestValidateVizual(unittest.TestCase):
             columns=[{'column': 1, 'name': 'TheName'}, {'column': 2}],
             validate=True
         ).to_external_form(
-            command=PACKAGE.get(vizual.VIZUAL_PROJECTION),
+            command=CMD_PROJECTION,
             datasets=DATASETS
         )
         self.assertEqual(cmd, 'FILTER COLUMNS Street, \'Some Name\' FROM ds')
@@ -122,7 +127,7 @@ class TestValidateVizual(unittest.TestCase):
             columns=[{'column': 1, 'order': 'A-Z'}, {'column': 2, 'order': 'Z-A'}],
             validate=True
         ).to_external_form(
-            command=PACKAGE.get(vizual.VIZUAL_SORT),
+            command=CMD_SORT,
             datasets=DATASETS
         )
         self.assertEqual(cmd, 'SORT ds BY Street (A-Z), \'Some Name\' (Z-A)')
@@ -136,7 +141,7 @@ class TestValidateVizual(unittest.TestCase):
             value='Some Value',
             validate=True
         ).to_external_form(
-            command=PACKAGE.get(vizual.VIZUAL_UPD_CELL),
+            command=CMD_UPD_CELL,
             datasets=DATASETS
         )
         self.assertEqual(cmd, 'UPDATE ds SET [\'Some Name\', 1] = \'Some Value\'')
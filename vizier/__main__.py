@@ -21,10 +21,6 @@ import os
 import sys
 from typing import List
 
-from vizier.api.client.cli import print_header
-from vizier.api.client.cli.interpreter import CommandInterpreter
-from vizier.api.routes.base import UrlFactory
-from vizier.core.annotation.persistent import PersistentAnnotationSet
 from vizier.core.io.base import read_object_from_file
 
 """Configuration files."""
@@ -55,6 +51,7 @@ def main(args: List[str]) -> None:
             url = 'http://localhost:5000/vizier-db/api/v1'
         else:
             # Print the URL of the API in the configuration file
+            from vizier.api.client.cli import print_header
             config = read_object_from_file(config_file)
             print_header()
             print('\nConnected to API at ' + config['url'])
@@ -66,6 +63,11 @@ def main(args: List[str]) -> None:
     elif not os.path.isfile(config_file):
         raise ValueError('vizier client is not initialized')
     else:
+        # Import the interpreter only when a command is evaluated. It pulls in
+        # the API client and all command package definitions.
+        from vizier.api.client.cli.interpreter import CommandInterpreter
+        from vizier.api.routes.base import UrlFactory
+        from vizier.core.annotation.persistent import PersistentAnnotationSet
         config = read_object_from_file(config_file)
         defaults_file = os.path.join(app_dir, 'defaults.json')
         defaults = PersistentAnnotationSet(object_path=defaults_file)
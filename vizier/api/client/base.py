@@ -60,6 +60,9 @@ class VizierApiClient(object):
             Annotation set for default values
         """
         self.urls = urls
+        # Share a single HTTP session between all requests (including those
+        # that are sent by notebooks) to reuse connections to the server.
+        self.session = requests.Session()
         # We only set the defaults if a value is given. Otherwise, the local
         # variables are not initialized.
         if defaults is not None:
@@ -111,7 +114,7 @@ class VizierApiClient(object):
             raise ValueError('invalid branch source')
         # Send request. Raise exception if status code indicates that the
         # request was not successful
-        r = requests.post(url, json=data)
+        r = self.session.post(url, json=data)
         r.raise_for_status()
         # The result is the new branch descriptor
         return BranchResource.from_dict(json.loads(r.text))
@@ -133,7 +136,7 @@ class VizierApiClient(object):
         data = {labels.PROPERTIES: serialize.PROPERTIES(properties)}
         # Send request. Raise exception if status code indicates that the
         # request was not successful
-        r = requests.post(url, json=data)
+        r = self.session.post(url, json=data)
         r.raise_for_status()
         # The result is the new project descriptor
         return ProjectResource.from_dict(json.loads(r.text))
@@ -159,7 +162,7 @@ class VizierApiClient(object):
         )
         # Send request. Raise exception if status code indicates that the
         # request was not successful. Otherwise return True.
-        r = requests.delete(url)
+        r = self.session.delete(url)
         r.raise_for_status()
         return True
 
@@ -179,7 +182,7 @@ class VizierApiClient(object):
         url = self.urls.delete_project(project_id)
         # Send request. Raise exception if status code indicates that the
         # request was not successful. Otherwise return True.
-        r = requests.delete(url)
+        r = self.session.delete(url)
         r.raise_for_status()
         return True
 
@@ -195,7 +198,7 @@ class VizierApiClient(object):
         -------
         vizier.api.client.resources.view.ChartView
         """
-        r = requests.get(url)
+        r = self.session.get(url)
         r.raise_for_status()
         return ChartView.from_dict(json.loads(r.text))
 
@@ -271,7 +274,8 @@ class VizierApiClient(object):
             workflow=self.get_workflow(
                 project_id=project_id,
                 branch_id=branch_id
-            )
+            ),
+            session=self.session
         )
 
     def get_project(self, project_id):
@@ -324,7 +328,7 @@ class VizierApiClient(object):
 
     def info(self) -> None:
         """Print information about the API (from the API service descriptor)."""
-        r = requests.get(self.urls.service_descriptor())
+        r = self.session.get(self.urls.service_descriptor())
         r.raise_for_status()
         doc = r.json()
         print('Name    : ' + doc['name'])
@@ -345,13 +349,11 @@ class VizierApiClient(object):
         # There is no separate API call to fetch all project branches. Fetch
         # the project handle instead which will contain the branch descriptors.
         url = self.urls.get_project(project_id)
-        response = urllib.request.urlopen(url)
-        data = json.loads(response.read())
+        r = self.session.get(url)
+        r.raise_for_status()
+        data = json.loads(r.content)
         # Convert branchs in result into list of branch resources
-        branches = list()
-        for obj in data['branches']:
-            branches.append(BranchResource.from_dict(obj))
-        return branches
+        return [BranchResource.from_dict(obj) for obj in data['branches']]
 
     def list_projects(self):
         """Fetch list of project from remote web service API.
@@ -362,13 +364,11 @@ class VizierApiClient(object):
         """
         # Fetch projects listing
         url = self.urls.list_projects()
-        response = urllib.request.urlopen(url)
-        data = json.loads(response.read())
+        r = self.session.get(url)
+        r.raise_for_status()
+        data = json.loads(r.content)
         # Convert result into list of project resources
-        projects = list()
-        for obj in data['projects']:
-            projects.append(ProjectResource.from_dict(obj))
-        return projects
+        return [ProjectResource.from_dict(obj) for obj in data['projects']]
 
     def update_branch(self, project_id, branch_id, properties):
         """Update the properties of a given project branch.
@@ -391,7 +391,7 @@ class VizierApiClient(object):
         data = {labels.PROPERTIES: serialize.PROPERTIES(properties)}
         # Send request. Raise exception if status code indicates that the
         # request was not successful
-        r = requests.put(url, json=data)
+        r = self.session.put(url, json=data)
         r.raise_for_status()
         # The result is the new project descriptor
         return BranchResource.from_dict(json.loads(r.text))
@@ -415,7 +415,7 @@ class VizierApiClient(object):
         data = {labels.PROPERTIES: serialize.PROPERTIES(properties)}
         # Send request. Raise exception if status code indicates that the
         # request was not successful
-        r = requests.put(url, json=data)
+        r = self.session.put(url, json=data)
         r.raise_for_status()
         # The result is the new project descriptor
         return ProjectResource.from_dict(json.loads(r.text))
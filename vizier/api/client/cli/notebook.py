@@ -22,6 +22,26 @@ from vizier.api.client.cli.util import ts
 from vizier.api.client.base import VizierApiClient
 
 
+"""Help statement for notebook commands."""
+HELP_TEXT = (
+    '\n'
+    'Notebooks\n'
+    '  [notebook | nb] append <command>\n'
+    '  [notebook | nb] cancel\n'
+    '  [notebook | nb] delete <module-id>\n'
+    '  [notebook | nb] insert before <module-id> <command>\n'
+    '  [notebook | nb] replace <module-id> <command>\n'
+    '  show chart <name> {in <module-id>}\n'
+    '  show [notebook | nb] {<workflow-id>}\n'
+    '\n'
+    'Datasets\n'
+    '  download dataset <name> {in <module-id>} to <target-path>\n'
+    '  show dataset <name> {in <module-id>}\n'
+    '\n'
+    'Commands'
+)
+
+
 class NotebookCommands(Command):
     """"Collection of commands that interact with a notebook."""
     def __init__(self, api: VizierApiClient):
@@ -201,18 +221,7 @@ class NotebookCommands(Command):
 
     def help(self):
         """Print help statement."""
-        print('\nNotebooks')
-        print('  [notebook | nb] append <command>')
-        print('  [notebook | nb] cancel')
-        print('  [notebook | nb] delete <module-id>')
-        print('  [notebook | nb] insert before <module-id> <command>')
-        print('  [notebook | nb] replace <module-id> <command>')
-        print('  show chart <name> {in <module-id>}')
-        print('  show [notebook | nb] {<workflow-id>}')
-        print('\nDatasets')
-        print('  download dataset <name> {in <module-id>} to <target-path>')
-        print('  show dataset <name> {in <module-id>}')
-        print('\nCommands')
+        print(HELP_TEXT)
         print_commands()
 
     def insert_module(self, command, notebook, before_module):
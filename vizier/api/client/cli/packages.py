@@ -17,6 +17,9 @@
 """Command line interface helper methods for parsing notebook cell commands."""
 
 import os
+import stat
+
+from functools import lru_cache
 
 from vizier.core.util import cast
 from vizier.engine.packages.base import FILE_ID, FILE_NAME, FILE_URL
@@ -27,6 +30,27 @@ import vizier.engine.packages.vizual.base as sort
 import vizier.engine.packages.vizual.command as vizual
 
 
+"""Syntax listing for supported notebook cell commands."""
+COMMANDS_TEXT = (
+    '  chart <name> on <dataset> with <column:label:start-end> ...\n'
+    '  delete column <name> from <dataset>\n'
+    '  delete row <row-index> from <dataset>\n'
+    '  drop dataset <dataset>\n'
+    '  filter <column-1>{::<new-name>} ... from <dataset>\n'
+    '  insert column <name> into <dataset> at position <column-index>\n'
+    '  insert row into <dataset> at position <row-index>\n'
+    '  load <name> from file <file>\n'
+    '  load <name> from url <url>\n'
+    '  move column <name> in <dataset> to position <column-index>\n'
+    '  move row <row-index> in <dataset> to position <target-index>\n'
+    '  python [<script> | <file>]\n'
+    '  rename column <name> in <dataset> to <new-name>\n'
+    '  rename dataset <dataset> to <new-name>\n'
+    '  sort <dataset> by <column-1>{::[DESC|ASC]} ...\n'
+    '  update <dataset-name> <column-name> <row-index>{ <value>}'
+)
+
+
 def get_script(script):
     """Return script code. If the script argument refers to an existing file on
     disk the file content is returned. Otherwise, the script value itself is
@@ -41,11 +65,42 @@ def get_script(script):
     -------
     string
     """
-    if os.path.isfile(script):
-        with open(script, 'r') as f:
-            return f.read()
-    else:
+    # Use a single stat() call to test whether the script refers to a file
+    try:
+        st = os.stat(script)
+        is_file = stat.S_ISREG(st.st_mode)
+    except (OSError, ValueError):
+        is_file = False
+    if not is_file:
         return script
+    return read_script_file(
+        filename=os.path.abspath(script),
+        mtime=st.st_mtime_ns,
+        size=st.st_size
+    )
+
+
+@lru_cache(maxsize=128)
+def read_script_file(filename, mtime, size):
+    """Read the content of a script file. Results are cached. The modification
+    time and size of the file are part of the cache key so that a changed file
+    is read again.
+
+    Parameters
+    ----------
+    filename: string
+        Absolute path to script file on local disk
+    mtime: int
+        File modification time in nanoseconds
+    size: int
+        File size in bytes
+
+    Returns
+    -------
+    string
+    """
+    with open(filename, 'r') as f:
+        return f.read()
 
 
 def parse_command(tokens, notebook, datasets=dict()):
@@ -122,70 +177,10 @@ def parse_command(tokens, notebook, datasets=dict()):
             columns=columns
         )
     elif len(tokens) == 5:
-        if tokens[0:2] == ['delete', 'column'] and tokens[3] == 'from':
-            # delete column <name> from <dataset>
-            dataset_name = tokens[4].lower()
-            if not dataset_name in datasets:
-                raise ValueError('unknown dataset \'' + dataset_name + '\'')
-            # Get the referenced dataset and column from the current notebook
-            # state
-            ds = notebook.get_dataset(datasets[dataset_name])
-            col = ds.get_column(tokens[2])
-            return vizual.delete_column(
-                dataset_name=dataset_name,
-                column=col.identifier
-            )
-        elif tokens[0:2] == ['delete', 'row'] and tokens[3] == 'from':
-            # delete row <row-index> from <dataset>
-            dataset_name = tokens[4].lower()
-            if not dataset_name in datasets:
-                raise ValueError('unknown dataset \'' + dataset_name + '\'')
-            return vizual.delete_row(
-                dataset_name=dataset_name,
-                row=int(tokens[2])
-            )
-        elif tokens[0] == 'load' and tokens[2] == 'from' and tokens[3] == 'file':
-            # load <name> from file <file>
-            filename = tokens[4]
-            file_id = notebook.upload_file(filename=filename)
-            return vizual.load_dataset(
-                dataset_name=tokens[1],
-                file={
-                    FILE_ID: file_id,
-                    FILE_NAME: os.path.basename(filename)
-                }
-            )
-        elif tokens[0] == 'load' and tokens[2] == 'from' and tokens[3] == 'url':
-            return vizual.load_dataset(
-                dataset_name=tokens[1],
-                file={FILE_URL: tokens[4]}
-            )
-        elif tokens[0:2] == ['rename', 'dataset'] and tokens[3] == 'to':
-            # rename dataset <dataset> to <new-name>
-            dataset_name = tokens[2].lower()
-            # Get the referenced dataset and column from the current notebook
-            # state
-            if not dataset_name in datasets:
-                raise ValueError('unknown dataset \'' + dataset_name + '\'')
-            return vizual.rename_dataset(
-                dataset_name=dataset_name,
-                new_name=tokens[4]
-            )
-        elif tokens[0] == 'update':
-            # update <dataset-name> <column-name> <row-index>{ <value>}\
-            dataset_name = tokens[1].lower()
-            # Get the referenced dataset and column from the current notebook
-            # state
-            if not dataset_name in datasets:
-                raise ValueError('unknown dataset \'' + dataset_name + '\'')
-            ds = notebook.get_dataset(datasets[dataset_name])
-            col = ds.get_column(tokens[2])
-            return vizual.update_cell(
-                dataset_name=dataset_name,
-                column=col.identifier,
-                row=int(tokens[3]),
-                value=cast(tokens[4])
-            )
+        # Five-token commands are dispatched on their first token
+        parser = FIVE_TOKEN_COMMANDS.get(tokens[0])
+        if not parser is None:
+            return parser(tokens, notebook, datasets)
     elif len(tokens) >= 6 and tokens[0] == 'chart':
         if tokens[0] == 'chart' and tokens[2] == 'on' and tokens[4] == 'with':
             # chart <chart-name> on <dataset-name> with <column-name:label:start-end> ...
@@ -269,21 +264,161 @@ def parse_command(tokens, notebook, datasets=dict()):
     return None
 
 
+def parse_delete_command(tokens, notebook, datasets):
+    """Parse a five-token command that deletes a column or a row from a
+    dataset. Returns None if the tokens do not specify a valid command.
+
+    Parameters
+    ----------
+    tokens: list(string)
+        Command line tokens specifying the command
+    notebook: vizier.api.client.resources.notebook.Notebook
+        Current notebook state
+    datasets: dict
+        Mapping of available dataset names to dataset identifier
+
+    Returns
+    -------
+    vizier.engine.module.command.ModuleCommand
+    """
+    if tokens[3] != 'from':
+        return None
+    if tokens[1] == 'column':
+        # delete column <name> from <dataset>
+        dataset_name = tokens[4].lower()
+        if not dataset_name in datasets:
+            raise ValueError('unknown dataset \'' + dataset_name + '\'')
+        # Get the referenced dataset and column from the current notebook
+        # state
+        ds = notebook.get_dataset(datasets[dataset_name])
+        col = ds.get_column(tokens[2])
+        return vizual.delete_column(
+            dataset_name=dataset_name,
+            column=col.identifier
+        )
+    elif tokens[1] == 'row':
+        # delete row <row-index> from <dataset>
+        dataset_name = tokens[4].lower()
+        if not dataset_name in datasets:
+            raise ValueError('unknown dataset \'' + dataset_name + '\'')
+        return vizual.delete_row(
+            dataset_name=dataset_name,
+            row=int(tokens[2])
+        )
+    return None
+
+
+def parse_load_command(tokens, notebook, datasets):
+    """Parse a five-token command that loads a dataset from a local file or
+    from a url. Returns None if the tokens do not specify a valid command.
+
+    The dataset file is uploaded before the command object is returned if the
+    dataset is loaded from a local file.
+
+    Parameters
+    ----------
+    tokens: list(string)
+        Command line tokens specifying the command
+    notebook: vizier.api.client.resources.notebook.Notebook
+        Current notebook state
+    datasets: dict
+        Mapping of available dataset names to dataset identifier
+
+    Returns
+    -------
+    vizier.engine.module.command.ModuleCommand
+    """
+    if tokens[2] != 'from':
+        return None
+    if tokens[3] == 'file':
+        # load <name> from file <file>
+        filename = tokens[4]
+        file_id = notebook.upload_file(filename=filename)
+        return vizual.load_dataset(
+            dataset_name=tokens[1],
+            file={
+                FILE_ID: file_id,
+                FILE_NAME: os.path.basename(filename)
+            }
+        )
+    elif tokens[3] == 'url':
+        # load <name> from url <url>
+        return vizual.load_dataset(
+            dataset_name=tokens[1],
+            file={FILE_URL: tokens[4]}
+        )
+    return None
+
+
+def parse_rename_command(tokens, notebook, datasets):
+    """Parse a five-token command that renames a dataset. Returns None if the
+    tokens do not specify a valid command.
+
+    Parameters
+    ----------
+    tokens: list(string)
+        Command line tokens specifying the command
+    notebook: vizier.api.client.resources.notebook.Notebook
+        Current notebook state
+    datasets: dict
+        Mapping of available dataset names to dataset identifier
+
+    Returns
+    -------
+    vizier.engine.module.command.ModuleCommand
+    """
+    if tokens[1] != 'dataset' or tokens[3] != 'to':
+        return None
+    # rename dataset <dataset> to <new-name>
+    dataset_name = tokens[2].lower()
+    if not dataset_name in datasets:
+        raise ValueError('unknown dataset \'' + dataset_name + '\'')
+    return vizual.rename_dataset(
+        dataset_name=dataset_name,
+        new_name=tokens[4]
+    )
+
+
+def parse_update_command(tokens, notebook, datasets):
+    """Parse a five-token command that updates the value of a dataset cell.
+
+    Parameters
+    ----------
+    tokens: list(string)
+        Command line tokens specifying the command
+    notebook: vizier.api.client.resources.notebook.Notebook
+        Current notebook state
+    datasets: dict
+        Mapping of available dataset names to dataset identifier
+
+    Returns
+    -------
+    vizier.engine.module.command.ModuleCommand
+    """
+    # update <dataset-name> <column-name> <row-index>{ <value>}
+    dataset_name = tokens[1].lower()
+    # Get the referenced dataset and column from the current notebook state
+    if not dataset_name in datasets:
+        raise ValueError('unknown dataset \'' + dataset_name + '\'')
+    ds = notebook.get_dataset(datasets[dataset_name])
+    col = ds.get_column(tokens[2])
+    return vizual.update_cell(
+        dataset_name=dataset_name,
+        column=col.identifier,
+        row=int(tokens[3]),
+        value=cast(tokens[4])
+    )
+
+
+"""Parsers for five-token commands indexed by the first command token."""
+FIVE_TOKEN_COMMANDS = {
+    'delete': parse_delete_command,
+    'load': parse_load_command,
+    'rename': parse_rename_command,
+    'update': parse_update_command
+}
+
+
 def print_commands():
     """Print command syntax listing for supported commands."""
-    print('  chart <name> on <dataset> with <column:label:start-end> ...')
-    print('  delete column <name> from <dataset>')
-    print('  delete row <row-index> from <dataset>')
-    print('  drop dataset <dataset>')
-    print('  filter <column-1>{::<new-name>} ... from <dataset>')
-    print('  insert column <name> into <dataset> at position <column-index>')
-    print('  insert row into <dataset> at position <row-index>')
-    print('  load <name> from file <file>')
-    print('  load <name> from url <url>')
-    print('  move column <name> in <dataset> to position <column-index>')
-    print('  move row <row-index> in <dataset> to position <target-index>')
-    print('  python [<script> | <file>]')
-    print('  rename column <name> in <dataset> to <new-name>')
-    print('  rename dataset <dataset> to <new-name>')
-    print('  sort <dataset> by <column-1>{::[DESC|ASC]} ...')
-    print('  update <dataset-name> <column-name> <row-index>{ <value>}')
+    print(COMMANDS_TEXT)
@@ -16,6 +16,8 @@
 
 """Collection of helper methods for the command line interface."""
 
+from functools import lru_cache
+
 from vizier.core.timestamp import utc_to_local
 
 
@@ -23,6 +25,16 @@ from vizier.core.timestamp import utc_to_local
 TIME_FORMAT = '%d-%m-%Y %H:%M:%S'
 
 
+@lru_cache(maxsize=4096)
 def ts(timestamp):
-    """Convert datatime timestamp to string."""
-    return utc_to_local(timestamp).strftime(TIME_FORMAT)
+    """Convert datatime timestamp to string. Results are cached since the same
+    timestamps are printed repeatedly in listings during a CLI session.
+
+    The result is formated according to TIME_FORMAT. The format is fixed so the
+    string is assembled directly instead of parsing the format via strftime.
+    """
+    dt = utc_to_local(timestamp)
+    return (
+        f'{dt.day:02d}-{dt.month:02d}-{dt.year:04d} '
+        f'{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}'
+    )
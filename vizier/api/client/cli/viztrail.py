@@ -24,6 +24,25 @@ from vizier.api.client.cli.util import ts
 from vizier.viztrail.named_object import PROPERTY_NAME
 from vizier.api.client.base import VizierApiClient
 
+"""Help statement for viztrail commands."""
+HELP_TEXT = (
+    '\n'
+    'Projects\n'
+    '  create branch <name>\n'
+    '  create branch <name> from module <module-id>\n'
+    '  create branch <name> from workflow <workflow-id> module <module-id>\n'
+    '  create branch <name>\n'
+    '  create project <name>\n'
+    '  delete branch <branch-id>\n'
+    '  delete project <project-id>\n'
+    '  list branches\n'
+    '  list projects\n'
+    '  rename branch <name>\n'
+    '  rename project <name>\n'
+    '  show [history | notebooks]'
+)
+
+
 class ViztrailsCommands(Command):
     """"Collection of commands that interact with the viztrails repository."""
     def __init__(self, api: VizierApiClient):
@@ -35,6 +54,22 @@ class ViztrailsCommands(Command):
             Vizier API client
         """
         self.api = api
+        # Dispatch tables for commands that are identified by their first two
+        # tokens. Commands with three tokens take the last token as argument.
+        self.commands_no_args = {
+            ('list', 'branches'): self.list_branches,
+            ('list', 'projects'): self.list_projects,
+            ('show', 'history'): self.list_workflows,
+            ('show', 'notebooks'): self.list_workflows
+        }
+        self.commands_one_arg = {
+            ('create', 'branch'): self.create_branch,
+            ('create', 'project'): self.create_project,
+            ('delete', 'branch'): self.delete_branch,
+            ('delete', 'project'): self.delete_project,
+            ('rename', 'branch'): self.rename_branch,
+            ('rename', 'project'): self.rename_project
+        }
 
     def create_branch(self, name, workflow_id=None, module_id=None):
         """Create a new branch in the default project."""
@@ -97,33 +132,21 @@ class ViztrailsCommands(Command):
         """
         if len(tokens) == 2:
             # list branches
-            if tokens[0] == 'list' and tokens[1] == 'branches':
-                return self.list_branches()
             # list projects
-            elif tokens[0] == 'list' and tokens[1] == 'projects':
-                return self.list_projects()
-            # show history
-            elif tokens[0] == 'show' and tokens[1] in ['history', 'notebooks']:
-                return self.list_workflows()
+            # show [history | notebooks]
+            cmd = self.commands_no_args.get((tokens[0], tokens[1]))
+            if not cmd is None:
+                return cmd()
         elif len(tokens) == 3:
             # create branch <name>
-            if tokens[0] == 'create' and tokens[1] == 'branch':
-                return self.create_branch(tokens[2])
             # create project <name>
-            elif tokens[0] == 'create' and tokens[1] == 'project':
-                return self.create_project(tokens[2])
             # delete branch <branch-id>
-            elif tokens[0] == 'delete' and tokens[1] == 'branch':
-                return self.delete_branch(tokens[2])
             # delete project <project-id>
-            elif tokens[0] == 'delete' and tokens[1] == 'project':
-                return self.delete_project(tokens[2])
             # rename branch <name>
-            elif tokens[0] == 'rename' and tokens[1] == 'branch':
-                return self.rename_branch(tokens[2])
             # rename project <name>
-            elif tokens[0] == 'rename' and tokens[1] == 'project':
-                return self.rename_project(tokens[2])
+            cmd = self.commands_one_arg.get((tokens[0], tokens[1]))
+            if not cmd is None:
+                return cmd(tokens[2])
         elif len(tokens) == 6:
             # create branch <name> from module <module-id>
             if tokens[0:2] == ['create', 'branch'] and tokens[3:5] == ['from', 'module']:
@@ -145,32 +168,15 @@ class ViztrailsCommands(Command):
 
     def help(self):
         """Print help statement."""
-        print('\nProjects')
-        print('  create branch <name>')
-        print('  create branch <name> from module <module-id>')
-        print('  create branch <name> from workflow <workflow-id> module <module-id>')
-        print('  create branch <name>')
-        print('  create project <name>')
-        print('  delete branch <branch-id>')
-        print('  delete project <project-id>')
-        print('  list branches')
-        print('  list projects')
-        print('  rename branch <name>')
-        print('  rename project <name>')
-        print('  show [history | notebooks]')
+        print(HELP_TEXT)
 
     def list_branches(self):
         """Print listing of branches for default project in tabular format."""
         branches = self.api.list_branches(self.api.get_default_project())
-        rows = list()
-        rows.append(['Identifier', 'Name', 'Created at', 'Last modified'])
-        for branch in branches:
-            rows.append([
-                branch.identifier,
-                branch.name,
-                ts(branch.created_at),
-                ts(branch.last_modified_at)
-            ])
+        rows = [['Identifier', 'Name', 'Created at', 'Last modified']] + [
+            [b.identifier, b.name, ts(b.created_at), ts(b.last_modified_at)]
+            for b in branches
+        ]
         print()
         self.output(rows)
         print('\n' + str(len(branches)) + ' branch(es)\n')
@@ -179,15 +185,10 @@ class ViztrailsCommands(Command):
     def list_projects(self):
         """Print listing of active projects in tabular format."""
         projects = self.api.list_projects()
-        rows = list()
-        rows.append(['Identifier', 'Name', 'Created at', 'Last modified'])
-        for project in projects:
-            rows.append([
-                project.identifier,
-                project.name,
-                ts(project.created_at),
-                ts(project.last_modified_at)
-            ])
+        rows = [['Identifier', 'Name', 'Created at', 'Last modified']] + [
+            [p.identifier, p.name, ts(p.created_at), ts(p.last_modified_at)]
+            for p in projects
+        ]
         print()
         self.output(rows)
         print('\n' + str(len(projects)) + ' project(s)\n')
@@ -201,15 +202,10 @@ class ViztrailsCommands(Command):
             project_id=self.api.get_default_project(),
             branch_id=self.api.get_default_branch()
         )
-        rows = list()
-        rows.append(['Identifier', 'Action', 'Command', 'Created at'])
-        for workflow in branch.workflows:
-            rows.append([
-                workflow.identifier,
-                workflow.action.upper(),
-                workflow.command,
-                ts(workflow.created_at)
-            ])
+        rows = [['Identifier', 'Action', 'Command', 'Created at']] + [
+            [wf.identifier, wf.action.upper(), wf.command, ts(wf.created_at)]
+            for wf in branch.workflows
+        ]
         print()
         self.output(rows)
         print('\n' + str(len(branch.workflows)) + ' workflow(s)\n')
@@ -14,12 +14,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import io
+import os
 import requests
+import uuid
 from typing import TYPE_CHECKING
+from urllib3.fields import RequestField
 
 from vizier.api.client.resources.workflow import WorkflowResource
 from vizier.api.client.datastore.base import DatastoreClient
+from vizier.core.util import parse_json
 if TYPE_CHECKING:
     from vizier.api.client.resources.dataset import DatasetDescriptor
 
@@ -64,8 +68,10 @@ class Notebook(object):
     """A notebook is a wrapper around a workflow instance for a particular
     project.
     """
-    def __init__(self, project_id, workflow):
-        """Initialize the internal components.
+    def __init__(self, project_id, workflow, session=None):
+        """Initialize the internal components. All requests are sent using the
+        given session to reuse connections to the server. If no session is
+        given a new session is created.
 
         Parameters
         ----------
@@ -73,10 +79,13 @@ class Notebook(object):
             Unique project identifier
         workflow: vizier.api.client.resources.workflow.WorkflowResource
             Workflow that defines the notebook
+        session: requests.Session, optional
+            HTTP session for requests to the server
         """
         self.project_id = project_id
         self.workflow = workflow
         self.links = workflow.links
+        self.session = session if session is not None else requests.Session()
 
     def append_cell(self, command):
         """Append a new module to the notebook that executes te given command.
@@ -98,12 +107,12 @@ class Notebook(object):
         }
         # Send request. Raise exception if status code indicates that the
         # request was not successful
-        r = requests.post(url, json=data)
+        r = self.session.post(url, json=data)
         r.raise_for_status()
         # The returned update statement is a reduced version of the workflow
         # handle that contains the modules that were affected by the append
         # operation
-        return WorkflowResource.from_dict(json.loads(r.text))
+        return WorkflowResource.from_dict(parse_json(r.content))
 
     def cancel_exec(self):
         """Cancel exection of tasks for the notebook.
@@ -113,27 +122,35 @@ class Notebook(object):
         vizier.api.client.resources.workflow.WorkflowResource
         """
         url = self.workflow.links[ref.WORKFLOW_CANCEL]
-        r = requests.post(url)
+        r = self.session.post(url)
         r.raise_for_status()
         # The returned update statement is a reduced version of the workflow
         # handle that contains the modules that were affected by the operation
-        return WorkflowResource.from_dict(json.loads(r.text))
+        return WorkflowResource.from_dict(parse_json(r.content))
 
     def delete_module(self, module_id):
-        """Delete the notebook module with the given identifier.
+        """Delete the notebook module with the given identifier. If the module
+        does not exist a ValueError exception is raised.
+
+        Parameters
+        ----------
+        module_id: string
+            Unique module identifier
 
         Returns
         -------
         vizier.api.client.resources.workflow.WorkflowResource
         """
         module = self.get_module(module_id)
+        if module is None:
+            raise ValueError('unknown module \'' + str(module_id) + '\'')
         url = module.links[ref.MODULE_DELETE]
-        r = requests.delete(url)
+        r = self.session.delete(url)
         r.raise_for_status()
         # The returned update statement is a reduced version of the
         # workflow handle that contains the modules that were affected
         # by the delete operation
-        return WorkflowResource.from_dict(json.loads(r.text))
+        return WorkflowResource.from_dict(parse_json(r.content))
 
     def download_dataset(self, dataset, target_file):
         """Download the given datast to the given target path.
@@ -146,7 +163,7 @@ class Notebook(object):
             Target path for storing downloaded file
         """
         url = dataset.links[ref.DATASET_DOWNLOAD]
-        r = requests.get(url, allow_redirects=True)
+        r = self.session.get(url, allow_redirects=True)
         with open(target_file, 'wb') as f:
             f.write(r.content)
 
@@ -177,10 +194,12 @@ class Notebook(object):
 
         Returns
         -------
+        vizier.api.client.resources.dataset.DatasetDescriptor
         """
-        if not identifier in self.workflow.datasets:
+        dataset = self.workflow.datasets.get(identifier)
+        if dataset is None:
             raise ValueError('unknown datasets \'' + identifier + '\'')
-        return self.workflow.datasets[identifier]
+        return dataset
 
     def get_module(self, module_id):
         """Get the workflow module with the given identifier. Returns None if
@@ -197,10 +216,7 @@ class Notebook(object):
         """
         if module_id is None and len(self.workflow.modules) > 0:
             return self.workflow.modules[-1]
-        for module in self.workflow.modules:
-            if module.identifier == module_id:
-                return module
-        return None
+        return self.workflow.get_module(module_id)
 
     def insert_cell(self, command, before_module):
         """Insert a new module to the notebook that executes te given command.
@@ -227,11 +243,11 @@ class Notebook(object):
         }
         # Send request. Raise exception if status code indicates that the
         # request was not successful
-        r = requests.post(url, json=data)
+        r = self.session.post(url, json=data)
         r.raise_for_status()
         # handle that contains the modules that were affected by the insert
         # operation
-        return WorkflowResource.from_dict(json.loads(r.text))
+        return WorkflowResource.from_dict(parse_json(r.content))
 
     def replace_cell(self, command, module_id):
         """Replace the command for the module with the given identifier.
@@ -257,11 +273,11 @@ class Notebook(object):
         }
         # Send request. Raise exception if status code indicates that the
         # request was not successful
-        r = requests.put(url, json=data)
+        r = self.session.put(url, json=data)
         r.raise_for_status()
         # handle that contains the modules that were affected by the replace
         # operation
-        return WorkflowResource.from_dict(json.loads(r.text))
+        return WorkflowResource.from_dict(parse_json(r.content))
 
     def upload_file(self, filename):
         """Upload a file from local disk to notebooks filestore. Returns the
@@ -278,9 +294,85 @@ class Notebook(object):
         """
         # Get the request Url and create the request body
         url = self.links[ref.FILE_UPLOAD]
-        files = {'file': open(filename,'rb')}
-        # Send request. The result is the handle for the uploaded file.
-        r = requests.post(url, files=files)
+        with open(filename, 'rb') as f:
+            # Stream the multipart request body from disk instead of having
+            # requests buffer the whole file in memory. The result is the
+            # handle for the uploaded file.
+            body = MultipartFileReader(
+                fileobj=f,
+                filename=os.path.basename(filename)
+            )
+            r = self.session.post(
+                url,
+                data=body,
+                headers={'Content-Type': body.content_type}
+            )
         r.raise_for_status()
         # The result is the file identifier
-        return json.loads(r.text)['id']
+        return parse_json(r.content)['id']
+
+
+class MultipartFileReader(object):
+    """File-like object that provides a multipart/form-data request body for
+    the upload of a single file. The file content is read on demand in chunks
+    while the request is sent. The total length of the body is known in
+    advance so that the request can be sent with a Content-Length header.
+    """
+    def __init__(self, fileobj, filename, field='file'):
+        """Initialize the file handle and the multipart header and footer.
+
+        Parameters
+        ----------
+        fileobj: file object
+            Open binary file handle for the uploaded file
+        filename: string
+            Name of the uploaded file in the request
+        field: string, optional
+            Name of the form field that contains the file
+        """
+        boundary = uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary=' + boundary
+        # Render the part headers the same way as requests does for files=
+        # so that the server receives the same request body as before.
+        part = RequestField(name=field, data=b'', filename=filename)
+        part.make_multipart()
+        head = (
+            '--' + boundary + '\r\n' + part.render_headers()
+        ).encode('utf-8')
+        tail = ('\r\n--' + boundary + '--\r\n').encode('utf-8')
+        file_size = os.fstat(fileobj.fileno()).st_size - fileobj.tell()
+        self.length = len(head) + file_size + len(tail)
+        self.parts = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+
+    def __len__(self):
+        """Total length of the request body in bytes.
+
+        Returns
+        -------
+        int
+        """
+        return self.length
+
+    def read(self, size=-1):
+        """Read up to size bytes from the request body. Reads the remaining
+        body if size is negative.
+
+        Parameters
+        ----------
+        size: int, optional
+            Maximum number of bytes that are read
+
+        Returns
+        -------
+        bytes
+        """
+        chunks = list()
+        while self.parts and (size < 0 or size > 0):
+            chunk = self.parts[0].read(size)
+            if not chunk:
+                self.parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b''.join(chunks)
@@ -49,6 +49,33 @@ class WorkflowResource(object):
         self.modules = modules
         self.datasets = datasets
         self.links = links
+        # Index of module positions by module identifier. The index is built
+        # on first access by get_module().
+        self._module_index = None
+
+    def get_module(self, module_id):
+        """Get the workflow module with the given identifier. Returns None if
+        no module with the given identifier exists.
+
+        Parameters
+        ----------
+        module_id: string
+            Unique module identifier
+
+        Returns
+        -------
+        vizier.api.client.resources.module.ModuleResource
+        """
+        if self.modules is None:
+            return None
+        if self._module_index is None:
+            self._module_index = {
+                m.identifier: i for i, m in enumerate(self.modules)
+            }
+        idx = self._module_index.get(module_id)
+        if idx is None:
+            return None
+        return self.modules[idx]
 
     @property
     def is_empty(self):
@@ -17,7 +17,11 @@
 """The url factory is used to generate urls for all resources (routes) that are
 accessible via the web service.
 """
+from functools import lru_cache
 from typing import Optional, Dict, List, Any, Tuple
+
+import sys
+
 import vizier.api.serialize.labels as labels
 
 
@@ -33,9 +37,55 @@ PAGE_OFFSET = 'offset'
 """Profiling."""
 FORCE_PROFILER = 'profile'
 
+"""Maximum number of memoized route urls per url factory."""
+URL_CACHE_MAXSIZE = 4096
+
+"""Url templates for all routes that do not have optional query arguments. The
+templates are keyed by the name of the url factory method that returns the
+url. The placeholder {base} refers to the service base url and {projects} to
+the projects url.
+"""
+URL_TEMPLATES = {
+    'list_projects': '{projects}',
+    'create_project': '{projects}',
+    'import_project': '{projects}/import',
+    'get_project': '{projects}/{project_id}',
+    'delete_project': '{projects}/{project_id}',
+    'update_project': '{projects}/{project_id}',
+    'create_branch': '{projects}/{project_id}/branches',
+    'get_branch': '{projects}/{project_id}/branches/{branch_id}',
+    'delete_branch': '{projects}/{project_id}/branches/{branch_id}',
+    'update_branch': '{projects}/{project_id}/branches/{branch_id}',
+    'get_branch_head': '{projects}/{project_id}/branches/{branch_id}/head',
+    'workflow_module_append': '{projects}/{project_id}/branches/{branch_id}/head',
+    'cancel_workflow': '{projects}/{project_id}/branches/{branch_id}/head/cancel',
+    'get_workflow': '{projects}/{project_id}/branches/{branch_id}/workflows/{workflow_id}',
+    'get_workflow_module': '{projects}/{project_id}/branches/{branch_id}/head/modules/{module_id}',
+    'workflow_module_delete': '{projects}/{project_id}/branches/{branch_id}/head/modules/{module_id}',
+    'workflow_module_insert': '{projects}/{project_id}/branches/{branch_id}/head/modules/{module_id}',
+    'workflow_module_replace': '{projects}/{project_id}/branches/{branch_id}/head/modules/{module_id}',
+    'get_chart_view': '{projects}/{project_id}/branches/{branch_id}/workflows/{workflow_id}/modules/{module_id}/charts/{chart_id}',
+    'create_dataset': '{projects}/{project_id}/datasets',
+    'get_dataset': '{projects}/{project_id}/datasets/{dataset_id}',
+    'download_dataset': '{projects}/{project_id}/datasets/{dataset_id}/csv',
+    'get_dataset_descriptor': '{projects}/{project_id}/datasets/{dataset_id}/descriptor',
+    'upload_file': '{projects}/{project_id}/files',
+    'download_file': '{projects}/{project_id}/files/{file_id}'
+}
+
+"""Routes with optional query arguments. Urls for these routes are created by
+the respective url factory methods.
+"""
+QUERY_ROUTES = frozenset(['dataset_pagination', 'get_dataset_caveats'])
+
 
 class UrlFactory(object):
     """Factory to create urls for all routes that the webservice supports."""
+    __slots__ = ('api_doc_url', 'base_url', 'projects_url', 'url_cache')
+
+    """Url templates that are used by url_for."""
+    url_templates: Dict[str, str] = URL_TEMPLATES
+
     def __init__(self, 
             base_url: Optional[str] = None, 
             api_doc_url: Optional[str] = None, 
@@ -67,12 +117,12 @@ class UrlFactory(object):
         if properties is not None and PROPERTIES_APIDOCURL in properties:
             self.api_doc_url = properties[PROPERTIES_APIDOCURL]
 
-        # Ensure that base_url does not end with a slash
-        while len(self.base_url) > 0:
-            if self.base_url[-1] == '/':
-                self.base_url = self.base_url[:-1]
-            else:
-                break
+        # Ensure that base_url does not end with a slash. Both url prefixes are
+        # interned since they are shared by all urls that the factory creates.
+        self.base_url = normalize_base_url(self.base_url)
+        self.projects_url = sys.intern(f'{self.base_url}/projects')
+        # Memoized route urls keyed by (route, arg1, arg2, ...)
+        self.url_cache: Dict[Tuple[str, ...], str] = dict()
 
     # --------------------------------------------------------------------------
     # Service
@@ -107,8 +157,8 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.list_projects()
-    
+        return self.url_for('create_project')
+
     def import_project(self) -> str:
         """Url to create a new project.
 
@@ -116,7 +166,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.base_url + '/projects/import'
+        return self.url_for('import_project')
 
     def delete_project(self, project_id: str) -> str:
         """Url to delete the project with the given identifier.
@@ -130,7 +180,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_project(project_id)
+        return self.url_for('delete_project', project_id=project_id)
 
     def get_project(self, project_id: str) -> str:
         """Url to retrieve the project with the given identifier.
@@ -144,7 +194,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.list_projects() + '/' + project_id
+        return self.url_for('get_project', project_id=project_id)
 
     def list_projects(self) -> str:
         """Url to retrieve the list of active projects.
@@ -153,7 +203,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.base_url + '/projects'
+        return self.url_for('list_projects')
 
     def update_project(self, project_id: str) -> str:
         """Url to update properties for the project with the given identifier.
@@ -167,7 +217,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_project(project_id)
+        return self.url_for('update_project', project_id=project_id)
 
     # --------------------------------------------------------------------------
     # Branches
@@ -186,7 +236,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_project(project_id) + '/branches'
+        return self.url_for('create_branch', project_id=project_id)
 
     def delete_branch(self, project_id: str, branch_id: str) -> str:
         """Url to delete the project branch with the given identifier.
@@ -202,7 +252,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_branch(project_id, branch_id)
+        return self.url_for(
+            'delete_branch',
+            project_id=project_id,
+            branch_id=branch_id
+        )
 
     def get_branch(self, project_id: str, branch_id: str) -> str:
         """Url to retrieve the project branch with the given identifier.
@@ -218,7 +272,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.create_branch(project_id) + '/' + branch_id
+        return self.url_for(
+            'get_branch',
+            project_id=project_id,
+            branch_id=branch_id
+        )
 
     def get_branch_head(self, project_id: str, branch_id: str) -> str:
         """Url to retrieve the workflow that is at the head of the given
@@ -235,7 +293,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_branch(project_id, branch_id) + '/head'
+        return self.url_for(
+            'get_branch_head',
+            project_id=project_id,
+            branch_id=branch_id
+        )
 
     def update_branch(self, project_id: str, branch_id: str) -> str:
         """Url to update properties for the project branch with the given
@@ -252,7 +314,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_branch(project_id, branch_id)
+        return self.url_for(
+            'update_branch',
+            project_id=project_id,
+            branch_id=branch_id
+        )
 
     # --------------------------------------------------------------------------
     # Workflows
@@ -271,7 +337,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_branch_head(project_id, branch_id) + '/cancel'
+        return self.url_for(
+            'cancel_workflow',
+            project_id=project_id,
+            branch_id=branch_id
+        )
 
     def get_workflow(self, project_id: str, branch_id: str, workflow_id: str) -> str:
         """Url to get the handle for a specified workflow.
@@ -289,7 +359,12 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_branch(project_id, branch_id) + '/workflows/' + workflow_id
+        return self.url_for(
+            'get_workflow',
+            project_id=project_id,
+            branch_id=branch_id,
+            workflow_id=workflow_id
+        )
 
     def get_workflow_module(self, project_id: str, branch_id: str, module_id: str) -> str:
         """Url to get the current state of the specified module in the head of
@@ -308,7 +383,12 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_branch_head(project_id, branch_id) + '/modules/' + module_id
+        return self.url_for(
+            'get_workflow_module',
+            project_id=project_id,
+            branch_id=branch_id,
+            module_id=module_id
+        )
 
     # --------------------------------------------------------------------------
     # Module
@@ -329,7 +409,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_branch_head(project_id, branch_id)
+        return self.url_for(
+            'workflow_module_append',
+            project_id=project_id,
+            branch_id=branch_id
+        )
 
     def workflow_module_delete(self, project_id: str, branch_id: str, module_id: str) -> str:
         """Url to delete a module in the head workflow of a given branch.
@@ -349,7 +433,12 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_workflow_module(project_id, branch_id, module_id)
+        return self.url_for(
+            'workflow_module_delete',
+            project_id=project_id,
+            branch_id=branch_id,
+            module_id=module_id
+        )
 
     def workflow_module_insert(self, project_id: str, branch_id: str, module_id: str) -> str:
         """Url to insert a module to a given branch before the module with the
@@ -370,7 +459,12 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_workflow_module(project_id, branch_id, module_id)
+        return self.url_for(
+            'workflow_module_insert',
+            project_id=project_id,
+            branch_id=branch_id,
+            module_id=module_id
+        )
 
     def workflow_module_replace(self, project_id: str, branch_id: str, module_id: str) -> str:
         """Url to replace a module in the head workflow of a given branch.
@@ -390,7 +484,12 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_workflow_module(project_id, branch_id, module_id)
+        return self.url_for(
+            'workflow_module_replace',
+            project_id=project_id,
+            branch_id=branch_id,
+            module_id=module_id
+        )
 
     # --------------------------------------------------------------------------
     # Datasets
@@ -407,7 +506,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_project(project_id) + '/datasets'
+        return self.url_for('create_dataset', project_id=project_id)
 
     def dataset_pagination(self, project_id: str, dataset_id: str, offset: int = 0, limit: Optional[int] = None) -> str:
         """Get Url for dataset row pagination.
@@ -428,11 +527,10 @@ class UrlFactory(object):
         -------
         string
         """
-        query = format_args([
-            (PAGE_OFFSET, offset),
-            (PAGE_LIMIT, limit)
-        ])
-        return self.get_dataset(project_id, dataset_id) + query
+        url = self.get_dataset(project_id, dataset_id)
+        if limit is not None:
+            return f'{url}?{PAGE_OFFSET}={offset}&{PAGE_LIMIT}={limit}'
+        return f'{url}?{PAGE_OFFSET}={offset}'
 
     def download_dataset(self, project_id: str, dataset_id: str) -> str:
         """Url to download a dataset in csv format.
@@ -448,7 +546,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_dataset(project_id, dataset_id) + '/csv'
+        return self.url_for(
+            'download_dataset',
+            project_id=project_id,
+            dataset_id=dataset_id
+        )
 
     def get_dataset(self, project_id: str, dataset_id: str, force_profiler: Optional[bool] = None) -> str:
         """Url to retrieve dataset rows.
@@ -464,9 +566,13 @@ class UrlFactory(object):
         -------
         string
         """
-        url = self.get_project(project_id) + '/datasets/' + dataset_id
+        url = self.url_for(
+            'get_dataset',
+            project_id=project_id,
+            dataset_id=dataset_id
+        )
         if force_profiler is not None and force_profiler:
-            url += "?{}=true".format(FORCE_PROFILER)
+            url = f'{url}?{FORCE_PROFILER}=true'
         return url
 
     def get_dataset_caveats(self, project_id: str, dataset_id: str, column_id: Optional[int] = None, row_id: Optional[str]=None) -> str:
@@ -487,7 +593,7 @@ class UrlFactory(object):
                     (labels.COLUMN, column_id), 
                     (labels.ROW, row_id)
                 ])
-        return self.get_dataset(project_id, dataset_id) + '/annotations' + args
+        return f'{self.get_dataset(project_id, dataset_id)}/annotations{args}'
 
     def get_dataset_descriptor(self, project_id: str, dataset_id: str) -> str:
         """Url to retrieve dataset descriptor.
@@ -503,7 +609,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_dataset(project_id, dataset_id) + '/descriptor'
+        return self.url_for(
+            'get_dataset_descriptor',
+            project_id=project_id,
+            dataset_id=dataset_id
+        )
 
     # --------------------------------------------------------------------------
     # Charts
@@ -532,8 +642,14 @@ class UrlFactory(object):
         -------
         string
         """
-        url = self.get_workflow(project_id, branch_id, workflow_id)
-        return url + '/modules/' + module_id + '/charts/' + chart_id
+        return self.url_for(
+            'get_chart_view',
+            project_id=project_id,
+            branch_id=branch_id,
+            workflow_id=workflow_id,
+            module_id=module_id,
+            chart_id=chart_id
+        )
 
 
     # --------------------------------------------------------------------------
@@ -553,7 +669,11 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.upload_file(project_id) + '/' + file_id
+        return self.url_for(
+            'download_file',
+            project_id=project_id,
+            file_id=file_id
+        )
 
     def upload_file(self, project_id: str) -> str:
         """File upload url for the given project.
@@ -567,7 +687,73 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_project(project_id) + '/files'
+        return self.url_for('upload_file', project_id=project_id)
+
+    # --------------------------------------------------------------------------
+    # Templates
+    # --------------------------------------------------------------------------
+    def url_for(self, name: str, **kwargs: Any) -> str:
+        """Get the url for the route with the given name. The name is the name
+        of the url factory method that returns the url and the keyword
+        arguments are the arguments for that method. Urls for routes that have
+        a template in the url_templates of the factory are formated from the
+        template and memoized. For all other routes the respective method is
+        called. Raises ValueError if the name does not refer to a route.
+
+        Parameters
+        ----------
+        name: string
+            Route name
+        kwargs: dict
+            Route arguments
+
+        Returns
+        -------
+        string
+        """
+        template = self.url_templates.get(name)
+        if template is None:
+            # Routes without a template in this factory are created by the
+            # factory method. Do not call any other factory attributes.
+            if name not in URL_TEMPLATES and name not in QUERY_ROUTES:
+                raise ValueError('unknown route \'' + name + '\'')
+            return getattr(self, name)(**kwargs)
+        key = (name,) + tuple(kwargs.values())
+        url = self.url_cache.get(key)
+        if url is None:
+            url = self.cache_url(
+                key,
+                template.format(
+                    base=self.base_url,
+                    projects=self.projects_url,
+                    **kwargs
+                )
+            )
+        return url
+
+    # --------------------------------------------------------------------------
+    # Helper Methods
+    # --------------------------------------------------------------------------
+    def cache_url(self, key: Tuple[str, ...], url: str) -> str:
+        """Add the url for the route with the given key to the url cache. The
+        cache is cleared when it reaches the maximum size to keep the memory
+        footprint of long-running services bounded.
+
+        Parameters
+        ----------
+        key: tuple
+            Route name followed by the route arguments
+        url: string
+            Url for the route
+
+        Returns
+        -------
+        string
+        """
+        if len(self.url_cache) >= URL_CACHE_MAXSIZE:
+            self.url_cache.clear()
+        self.url_cache[key] = url
+        return url
 
 
 def format_args(args: List[Tuple[str, Any]]) -> str:
@@ -578,4 +764,23 @@ def format_args(args: List[Tuple[str, Any]]) -> str:
             "{}={}".format(arg, value) 
             for arg, value in args
             if value is not None
-        )
\ No newline at end of file
+        )
+
+
+@lru_cache(maxsize=256)
+def normalize_base_url(url: str) -> str:
+    """Remove trailing slashes from the given base url. The result is interned
+    since the base url is the prefix for all urls that a url factory creates.
+    Url factories are created repeatedly for the same base url, so results
+    are cached.
+
+    Parameters
+    ----------
+    url: string
+        Base url for a web service
+
+    Returns
+    -------
+    string
+    """
+    return sys.intern(url.rstrip('/'))
@@ -19,15 +19,53 @@ project wrapped inside an individual container.
 """
 from typing import Optional, TYPE_CHECKING
 
-from vizier.api.routes.base import PAGE_LIMIT, PAGE_OFFSET, UrlFactory, FORCE_PROFILER
+import sys
+
+from vizier.api.routes.base import PAGE_LIMIT, PAGE_OFFSET, UrlFactory
+from vizier.api.routes.base import URL_TEMPLATES, normalize_base_url
 if TYPE_CHECKING:
     from vizier.engine.project.cache.container import ContainerProjectCache
 
 
+"""Url templates for the project container API. Datasets and files are served
+directly under the base url of the container.
+"""
+CONTAINER_API_URL_TEMPLATES = dict(URL_TEMPLATES)
+CONTAINER_API_URL_TEMPLATES.update({
+    'get_dataset': '{base}/datasets/{dataset_id}',
+    'download_dataset': '{base}/datasets/{dataset_id}/csv',
+    'get_dataset_descriptor': '{base}/datasets/{dataset_id}/descriptor',
+    'upload_file': '{base}/files',
+    'download_file': '{base}/files/{file_id}'
+})
+
+"""Routes that the container engine delegates to the url factory of the
+respective project container.
+"""
+PROJECT_CONTAINER_ROUTES = frozenset([
+    'get_dataset',
+    'download_dataset',
+    'get_dataset_descriptor',
+    'upload_file',
+    'download_file'
+])
+
+"""Url templates for the container engine."""
+CONTAINER_ENGINE_URL_TEMPLATES = {
+    name: template for name, template in URL_TEMPLATES.items()
+    if name not in PROJECT_CONTAINER_ROUTES
+}
+
+
 class ContainerApiUrlFactory(UrlFactory):
     """Factory to create urls for all routes that are supported by a vizier
     API running in a separate container serving a single project.
     """
+    __slots__ = ()
+
+    """Url templates that are used by url_for."""
+    url_templates = CONTAINER_API_URL_TEMPLATES
+
     def __init__(self, 
             base_url: str, 
             api_doc_url: Optional[str] = None):
@@ -41,14 +79,11 @@ class ContainerApiUrlFactory(UrlFactory):
         api_doc_url: string, optional
             Url for the API documentation
         """
-        self.base_url = base_url
         self.api_doc_url = api_doc_url
         # Ensure that base_url does not end with a slash
-        while len(self.base_url) > 0:
-            if self.base_url[-1] == '/':
-                self.base_url = self.base_url[:-1]
-            else:
-                break
+        self.base_url = normalize_base_url(base_url)
+        self.projects_url = sys.intern(f'{self.base_url}/projects')
+        self.url_cache = dict()
 
     # --------------------------------------------------------------------------
     # Service
@@ -102,41 +137,6 @@ class ContainerApiUrlFactory(UrlFactory):
     # --------------------------------------------------------------------------
     # Datasets
     # --------------------------------------------------------------------------
-    def get_dataset(self, project_id: str, dataset_id: str, force_profiler: Optional[bool] = None) -> str:
-        """Url to retrieve dataset rows.
-
-        Parameters
-        ----------
-        project_id: string
-            Unique project identifier
-        dataset_id: string
-            Unique dataset identifier
-
-        Returns
-        -------
-        string
-        """
-        url = self.base_url + '/datasets/' + dataset_id
-        if force_profiler is not None and force_profiler:
-            url += "?{}=true".format(FORCE_PROFILER)
-        return url
-
-    def get_dataset_descriptor(self, project_id, dataset_id):
-        """Url to retrieve dataset descriptor.
-
-        Parameters
-        ----------
-        project_id: string
-            Unique project identifier
-        dataset_id: string
-            Unique dataset identifier
-
-        Returns
-        -------
-        string
-        """
-        return self.get_dataset(project_id, dataset_id) + '/descriptor'
-
     def dataset_pagination(self, project_id, dataset_id, offset=0, limit=None):
         """Get Url for dataset row pagination.
 
@@ -156,26 +156,10 @@ class ContainerApiUrlFactory(UrlFactory):
         -------
         string
         """
-        query = PAGE_OFFSET + '=' + str(offset)
+        url = self.get_dataset(project_id, dataset_id)
         if not limit is None:
-            query += '&' + PAGE_LIMIT + '=' + str(limit)
-        return self.get_dataset(project_id, dataset_id) + '?' + query
-
-    def download_dataset(self, project_id: str, dataset_id: str) -> str:
-        """Url to download a dataset in csv format.
-
-        Parameters
-        ----------
-        project_id: string
-            Unique project identifier
-        dataset_id: string
-            Unique dataset identifier
-
-        Returns
-        -------
-        string
-        """
-        return self.get_dataset(project_id, dataset_id) + '/csv'
+            return f'{url}?{PAGE_OFFSET}={offset}&{PAGE_LIMIT}={limit}'
+        return f'{url}?{PAGE_OFFSET}={offset}'
 
     def get_dataset_caveats(self, project_id, dataset_id):
         """Url to retrieve dataset annotations.
@@ -191,40 +175,7 @@ class ContainerApiUrlFactory(UrlFactory):
         -------
         string
         """
-        return self.get_dataset(project_id, dataset_id) + '/annotations'
-
-    # --------------------------------------------------------------------------
-    # Files
-    # --------------------------------------------------------------------------
-    def download_file(self, project_id, file_id):
-        """File download url.
-
-        Parameters
-        ----------
-        project_id: string
-            Unique project identifier
-        file_id: string
-            Unique file identifier
-
-        Returns
-        -------
-        string
-        """
-        return self.base_url + '/files/' + file_id
-
-    def upload_file(self, project_id: str) -> str:
-        """File upload url for the given project.
-
-        Parameters
-        ----------
-        project_id: string
-            Unique project identifier
-
-        Returns
-        -------
-        string
-        """
-        return self.base_url + '/files'
+        return f'{self.get_dataset(project_id, dataset_id)}/annotations'
 
 
 class ContainerEngineUrlFactory(UrlFactory):
@@ -233,6 +184,11 @@ class ContainerEngineUrlFactory(UrlFactory):
     that create urls for resoures that are accessible directly via the project
     container API.
     """
+    __slots__ = ('projects',)
+
+    """Url templates that are used by url_for."""
+    url_templates = CONTAINER_ENGINE_URL_TEMPLATES
+
     def __init__(self, 
             base_url: str, 
             projects: "ContainerProjectCache", 
@@ -276,9 +232,60 @@ class ContainerEngineUrlFactory(UrlFactory):
         project = self.projects.get_project(project_id)
         return project.urls.get_dataset(project_id, dataset_id, force_profiler = force_profiler)
 
+    def download_dataset(self, project_id: str, dataset_id: str) -> str:
+        """Url to download a dataset in csv format.
+
+        Parameters
+        ----------
+        project_id: string
+            Unique project identifier
+        dataset_id: string
+            Unique dataset identifier
+
+        Returns
+        -------
+        string
+        """
+        project = self.projects.get_project(project_id)
+        return project.urls.download_dataset(project_id, dataset_id)
+
+    def get_dataset_descriptor(self, project_id: str, dataset_id: str) -> str:
+        """Url to retrieve dataset descriptor.
+
+        Parameters
+        ----------
+        project_id: string
+            Unique project identifier
+        dataset_id: string
+            Unique dataset identifier
+
+        Returns
+        -------
+        string
+        """
+        project = self.projects.get_project(project_id)
+        return project.urls.get_dataset_descriptor(project_id, dataset_id)
+
     # --------------------------------------------------------------------------
     # Files
     # --------------------------------------------------------------------------
+    def download_file(self, project_id: str, file_id: str) -> str:
+        """File download url.
+
+        Parameters
+        ----------
+        project_id: string
+            Unique project identifier
+        file_id: string
+            Unique file identifier
+
+        Returns
+        -------
+        string
+        """
+        project = self.projects.get_project(project_id)
+        return project.urls.download_file(project_id, file_id)
+
     def upload_file(self, project_id: str) -> str:
         """File upload url for the given project.
 
@@ -99,17 +99,3 @@ class DatastoreClientUrlFactory(object):
         string
         """
         return self.urls.get_dataset_descriptor(self.project_id, dataset_id)
-
-    def update_dataset_annotations(self, dataset_id):
-        """Url to update dataset annotations.
-
-        Parameters
-        ----------
-        dataset_id: string
-            Unique dataset identifier
-
-        Returns
-        -------
-        string
-        """
-        return self.urls.update_dataset_annotations(self.project_id, dataset_id)
@@ -19,7 +19,7 @@
 workers to update the status of a task.
 """
 
-from vizier.api.routes.base import PROPERTIES_BASEURL
+from vizier.api.routes.base import PROPERTIES_BASEURL, normalize_base_url
 
 
 class TaskUrlFactory(object):
@@ -45,11 +45,7 @@ class TaskUrlFactory(object):
         if self.base_url is None:
             raise ValueError('missing base url argument')
         # Ensure that base_url does not end with a slash
-        while len(self.base_url) > 0:
-            if self.base_url[-1] == '/':
-                self.base_url = self.base_url[:-1]
-            else:
-                break
+        self.base_url = normalize_base_url(self.base_url)
 
     def set_task_state(self, task_id):
         """Url to modify the state of a given task.
@@ -38,7 +38,8 @@ def HATEOAS(links: Dict[str, Optional[str]]) -> List[Dict[str, Optional[str]]]:
     -------
     list
     """
-    return [{labels.REL: key, labels.HREF: links[key]} for key in links]
+    rel, href = labels.REL, labels.HREF
+    return [{rel: key, href: url} for key, url in links.items()]
 
 
 def PROPERTIES(properties: Dict[str, Any]) -> List[Dict[str, Any]]:
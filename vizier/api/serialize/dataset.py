@@ -17,18 +17,27 @@
 """This module contains helper methods for the webservice that are used to
 serialize datasets.
 """
+from operator import attrgetter
 from typing import Dict, Any, Optional, List
 
 import vizier.api.serialize.base as serialize
 import vizier.api.routes.base as routes
 import vizier.api.serialize.hateoas as ref
-import vizier.api.serialize.labels as labels
+from vizier.api.serialize.labels import (
+    COLUMNS, DATATYPE, ID, KEY, LINKS, NAME, OBJECT_TYPE, OFFSET,
+    PROPERTIES, ROWCAVEATFLAGS, ROWCOUNT, ROWS, ROWVALUES
+)
 from vizier.datastore.dataset import DatasetColumn, DatasetRow, DatasetDescriptor, DatasetHandle
 from vizier.datastore.artifact import ArtifactDescriptor
 from vizier.datastore.annotation.base import DatasetCaveat
 from vizier.engine.project.base import ProjectHandle
 from vizier.api.routes.base import UrlFactory
 
+
+"""Getter for the serialized properties of a dataset column."""
+COLUMN_PROPERTIES = attrgetter('identifier', 'name', 'data_type')
+
+
 def CAVEAT(caveat: DatasetCaveat) -> Dict[str, Any]:
     """Get dictionary serialization for a dataset annotation.
 
@@ -57,9 +66,9 @@ def DATASET_COLUMN(column: DatasetColumn) -> Dict[str, Any]:
     dict
     """
     return {
-        labels.ID: column.identifier,
-        labels.NAME: column.name,
-        labels.DATATYPE: column.data_type,
+        ID: column.identifier,
+        NAME: column.name,
+        DATATYPE: column.data_type,
     }
 
 
@@ -84,17 +93,17 @@ def ARTIFACT_DESCRIPTOR(
     dict
     """
     obj = {
-        labels.KEY: artifact.identifier,
-        labels.ID: artifact.identifier,
-        labels.OBJECT_TYPE: artifact.artifact_type
+        KEY: artifact.identifier,
+        ID: artifact.identifier,
+        OBJECT_TYPE: artifact.artifact_type
     }
     #if not name is None:
-    #   obj[labels.NAME] = name
+    #   obj[NAME] = name
     # Add self reference if the project and url factory are given
     # if not project is None and not urls is None:
     #     project_id = project.identifier
     #     dataobj_id = artifact.identifier
-    #     obj[labels.LINKS] = {}
+    #     obj[LINKS] = {}
     return obj
 
 def DATASET_DESCRIPTOR(
@@ -122,14 +131,17 @@ def DATASET_DESCRIPTOR(
     """
 
     obj = {
-        labels.ID: dataset.identifier,
-        labels.COLUMNS: [DATASET_COLUMN(col) for col in dataset.columns]#,
-        #labels.ROWCOUNT: dataset.row_count
+        ID: dataset.identifier,
+        COLUMNS: [
+            {ID: col_id, NAME: col_name, DATATYPE: col_type}
+            for col_id, col_name, col_type in map(COLUMN_PROPERTIES, dataset.columns)
+        ]#,
+        #ROWCOUNT: dataset.row_count
     }
     if not name is None:
-        obj[labels.NAME] = name
+        obj[NAME] = name
     elif not dataset.name is None:
-        obj[labels.NAME] = dataset.name
+        obj[NAME] = dataset.name
     # Add self reference if the project and url factory are given
     if project is not None and urls is not None:
         project_id = project.identifier
@@ -138,7 +150,7 @@ def DATASET_DESCRIPTOR(
             project_id=project_id,
             dataset_id=dataset_id
         )
-        obj[labels.LINKS] = serialize.HATEOAS({
+        obj[LINKS] = serialize.HATEOAS({
             ref.SELF: dataset_url,
             ref.DATASET_FETCH_ALL: dataset_url + '?' + routes.PAGE_LIMIT + '=-1',
             ref.DATASET_DOWNLOAD: urls.download_dataset(
@@ -193,12 +205,12 @@ def DATASET_HANDLE(
     for row in rows:
         serialized_rows.append(DATASET_ROW(row))
     # Serialize the dataset schema and cells
-    obj[labels.ROWS] = serialized_rows
-    obj[labels.ROWCOUNT] = dataset.row_count
-    obj[labels.OFFSET] = offset
-    obj[labels.PROPERTIES] = dataset.get_properties()
+    obj[ROWS] = serialized_rows
+    obj[ROWCOUNT] = dataset.row_count
+    obj[OFFSET] = offset
+    obj[PROPERTIES] = dataset.get_properties()
     # Add pagination references
-    links = obj[labels.LINKS]
+    links = obj[LINKS]
     # Max. number of records shown
     if not limit is None and int(limit) >= 0:
         max_rows_per_request = int(limit)
@@ -284,8 +296,8 @@ def DATASET_IDENTIFIER(identifier: str, name: str) -> Dict[str, Any]:
     dict
     """
     return {
-        labels.ID: identifier,
-        labels.NAME: name
+        ID: identifier,
+        NAME: name
     }
 
 
@@ -303,7 +315,7 @@ def DATASET_ROW(row: DatasetRow) -> Dict[str, Any]:
     """
   
     return {
-        labels.ID: row.identifier,
-        labels.ROWVALUES: row.values,
-        labels.ROWCAVEATFLAGS: row.caveats
+        ID: row.identifier,
+        ROWVALUES: row.values,
+        ROWCAVEATFLAGS: row.caveats
     }
@@ -18,7 +18,7 @@
 created by the serializers back into instances of the respective Python
 classes.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 
 from vizier.datastore.annotation.base import DatasetCaveat
 from vizier.datastore.dataset import DatasetColumn, DatasetDescriptor, DatasetRow
@@ -26,7 +26,14 @@ from vizier.viztrail.module.output import ModuleOutputs, OutputObject
 from vizier.viztrail.module.provenance import ModuleProvenance
 from vizier.api.base import InvalidRequest
 
-import vizier.api.serialize.labels as labels
+from vizier.api.serialize.labels import (
+    COLUMNS, DATATYPE, HREF, ID, KEY, NAME, REL, ROWCAVEATFLAGS, ROWVALUES,
+    VALUE
+)
+
+
+"""Valid elements in the serialization of an object property."""
+PROPERTY_ELEMENTS = frozenset([KEY, VALUE])
 
 
 def CAVEAT(obj: Dict[str, Any]) -> DatasetCaveat:
@@ -58,9 +65,9 @@ def DATASET_DESCRIPTOR(obj: Dict[str, Any]) -> DatasetDescriptor:
     vizier.datastore.dataset.DatasetDescriptor
     """
     return DatasetDescriptor(
-        identifier=obj[labels.ID],
-        name=obj[labels.NAME],
-        columns=DATASET_COLUMNS(obj[labels.COLUMNS])
+        identifier=obj[ID],
+        name=obj[NAME],
+        columns=DATASET_COLUMNS(obj[COLUMNS])
     )
 
 
@@ -76,12 +83,11 @@ def DATASET_COLUMNS(obj: List[Dict[str, Any]]) -> List[DatasetColumn]:
     -------
     list
     """
+    # Bind the column class to a local to avoid repeated global lookups for
+    # datasets with many columns
+    column = DatasetColumn
     return [
-        DatasetColumn(
-            identifier=col[labels.ID],
-            name=col[labels.NAME],
-            data_type=col[labels.DATATYPE]
-        )
+        column(col[ID], col[NAME], col[DATATYPE])
         for col in obj
     ]
 
@@ -99,16 +105,18 @@ def DATASET_ROW(obj: Dict[str, Any]) -> DatasetRow:
     vizier.datastore.dataset.DatasetRow
     """
     return DatasetRow(
-        identifier=obj[labels.ID], 
-        values=obj[labels.ROWVALUES], 
-        caveats=obj[labels.ROWCAVEATFLAGS]
+        identifier=obj[ID], 
+        values=obj[ROWVALUES], 
+        caveats=obj[ROWCAVEATFLAGS]
     )
 
 
-def HATEOAS(links: List[Dict[str, Any]]) -> Dict[str, Any]:
+def HATEOAS(links: Union[List[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
     """Convert a list of references into a dictionary. The reference relation
     is the key for the dictionary and the reference href element the value.
 
+    If the given links are already a dictionary they are returned as is.
+
     Parameters
     ----------
     links: list
@@ -118,10 +126,9 @@ def HATEOAS(links: List[Dict[str, Any]]) -> Dict[str, Any]:
     -------
     dict
     """
-    result = dict()
-    for ref in links:
-        result[ref[labels.REL]] = ref[labels.HREF]
-    return result
+    if isinstance(links, dict):
+        return links
+    return {ref[REL]: ref[HREF] for ref in links}
 
 
 def OUTPUTS(obj):
@@ -140,23 +147,20 @@ def OUTPUTS(obj):
     -------
     vizier.viztrail.module.output.ModuleOutputs
     """
+    output = OutputObject
     try:
         return ModuleOutputs(
             stdout=[
-                OutputObject(
-                    type=o['type'],
-                    value=o['value']
-                ) for o in obj['stdout']
+                output(o['type'], o['value'])
+                for o in obj['stdout']
             ],
             stderr=[
-                OutputObject(
-                    type=o['type'],
-                    value=o['value']
-                ) for o in obj['stderr']
+                output(o['type'], o['value'])
+                for o in obj['stderr']
             ]
         )
     except KeyError as ex:
-        raise ValueError(ex)
+        raise ValueError(f'missing element {ex} in module outputs') from None
 
 
 def PROPERTIES(properties, allow_null=False):
@@ -179,19 +183,15 @@ def PROPERTIES(properties, allow_null=False):
     for prop in properties:
         if not isinstance(prop, dict):
             raise InvalidRequest('expected property to be a dictionary')
-        name = None
-        value = None
-        for key in prop:
-            if key  == labels.KEY:
-                name = prop[key]
-            elif key == labels.VALUE:
-                value = prop[key]
-            else:
-                raise ValueError('invalid property element \'' + key + '\'')
+        invalid = prop.keys() - PROPERTY_ELEMENTS
+        if invalid:
+            raise ValueError(f'invalid property element \'{next(iter(invalid))}\'')
+        name = prop.get(KEY)
+        value = prop.get(VALUE)
         if name is None:
             raise ValueError('missing element \'key\' in property')
         if value is None and not allow_null:
-            raise ValueError('missing property value for \'' + name + '\'')
+            raise ValueError(f'missing property value for \'{name}\'')
         result[name] = value
     return result
 
@@ -211,28 +211,21 @@ def PROVENANCE(obj):
     """
     # All components are optional
     # Dictionary of datasets that were read
-    read=None
+    read = None
     if 'read' in obj:
-        read = dict()
-        for ds in obj['read']:
-            read[ds[labels.NAME]] = ds[labels.ID]
+        read = {ds[NAME]: ds[ID] for ds in obj['read']}
     # Dictionary of datasets that were written
-    write=None
+    write = None
     if 'write' in obj:
-        write = dict()
-        for ds in obj['write']:
-            if 'dataset' in ds:
-                write[ds[labels.NAME]] = DATASET_DESCRIPTOR(ds['dataset'])
-            else:
-                write[ds[labels.NAME]] = None
-    # names of datasets that were deleted
-    delete=None
-    if 'delete' in obj:
-        delete = obj['delete']
-    # Optional resource information (dictionary)
-    resources=None
-    if 'resources' in obj:
-        resources = obj['resources']
+        write = {
+            ds[NAME]: (
+                DATASET_DESCRIPTOR(ds['dataset']) if 'dataset' in ds else None
+            )
+            for ds in obj['write']
+        }
+    # Names of datasets that were deleted and optional resource information
+    delete = obj.get('delete')
+    resources = obj.get('resources')
     return ModuleProvenance(
         read=read,
         write=write,
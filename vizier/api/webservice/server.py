@@ -27,12 +27,13 @@ import io
 import tarfile
 import traceback
 
-from flask import Blueprint, jsonify, make_response, request, send_file, send_from_directory
+from flask import Blueprint, Response, jsonify, make_response, request, send_file, send_from_directory
 from werkzeug.utils import secure_filename
 
 from vizier.api.routes.base import PAGE_LIMIT, PAGE_OFFSET, FORCE_PROFILER
 from vizier.api.webservice.base import VizierApi
 from vizier.config.app import AppConfig
+from vizier.core.util import dumps_json
 
 import vizier.api.base as srv
 import vizier.api.serialize.deserialize as deserialize
@@ -757,7 +758,7 @@ def get_dataset_descriptor(project_id, dataset_id):
             dataset_id=dataset_id
         )
         if not dataset is None:
-            return jsonify(dataset)
+            return Response(dumps_json(dataset), mimetype='application/json')
     except ValueError as ex:
         raise srv.InvalidRequest(str(ex))
     raise srv.ResourceNotFound('unknown project \'' + project_id + '\' or dataset \'' + dataset_id + '\'')
@@ -16,6 +16,8 @@
 
 """Helper methods to configure the celery backend."""
 
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, Optional
 from vizier.config.app import AppConfig
 
@@ -38,11 +40,19 @@ def config_routes(config: AppConfig) -> Optional[Dict[str, Dict[str, str]]]:
     """
     routes: Optional[Dict[str, Dict[str, str]]] = None
     routing = config.engine.backend.celery.routes
-    if routing is not None and not routing.strip() != '':
-        routes = dict()
+    if routing is not None and routing.strip() != '':
+        # Split route strings into (package, command, queue) triples. Raises
+        # ValueError for malformed route strings. The triples are grouped by
+        # package (sorting is stable, so later entries for the same command
+        # still take precedence).
+        elements = list()
         for rt in routing.split(':'):
             package_id, command_id, queue = rt.split('.')
-            if package_id not in routes:
-                routes[package_id] = dict()
-            routes[package_id][command_id] = queue
+            elements.append((package_id, command_id, queue))
+        package = itemgetter(0)
+        elements.sort(key=package)
+        routes = {
+            package_id: {command_id: queue for _, command_id, queue in group}
+            for package_id, group in groupby(elements, key=package)
+        }
     return routes
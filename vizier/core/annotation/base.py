@@ -28,6 +28,11 @@ for an individual object in a persistent manner.
 from abc import abstractmethod
 from typing import Dict, Optional, Any, List
 
+
+"""Types of scalar values that can be associated with an annotation key."""
+SCALAR_TYPES = frozenset([int, float, str])
+
+
 class ObjectAnnotationSet(list):
     """Interface for accessing and manipulating user-defined annotations.
     Annotations are (key,value) pairs. For each key we maintain a list of
@@ -240,7 +245,7 @@ class DefaultAnnotationSet(ObjectAnnotationSet):
             Flag indicating whether the changes are to be persisted immediately
         """
         # Ensure that the value is a scalar value
-        if value is None or not type(value) in [int, float, str, str, str]:
+        if type(value) not in SCALAR_TYPES:
             raise ValueError('invalid annotation value type \'' + str(type(value)) + '\'')
         # Set the value if the replace flag is True or no prior annotation for
         # the given key exists
@@ -254,11 +259,10 @@ class DefaultAnnotationSet(ObjectAnnotationSet):
                 if replace:
                     self.elements[key] = value
                 else:
-                    # Find the given value in the list of associated values
-                    for i in range(len(el)):
-                        if el[i] == value:
-                            # No changes
-                            return
+                    # No changes if the given value is already in the list of
+                    # associated values
+                    if value in el:
+                        return
                     el.append(value)
             elif el == value:
                 # No changes
@@ -303,16 +307,11 @@ class DefaultAnnotationSet(ObjectAnnotationSet):
             if value is not None:
                 el = self.elements[key]
                 if isinstance(el, list):
-                    # Find the given value in the list of associated values
-                    index = -1
-                    for i in range(len(el)):
-                        if el[i] == value:
-                            index = i
-                            break
-                    if index > -1:
-                        # The value was found in the list
-                        del el[index]
-                    else:
+                    # Remove the first occurrence of the given value from the
+                    # list of associated values
+                    try:
+                        el.remove(value)
+                    except ValueError:
                         # No changes
                         return False
                 else:
@@ -360,8 +359,9 @@ class DefaultAnnotationSet(ObjectAnnotationSet):
                 # with a single value.
                 return [el]
         else:
-            # Unknown key. Return default value
-            return default_value
+            # Unknown key. Return a copy of the default value so that changes
+            # to the result do not modify the shared default list
+            return list(default_value)
 
     def get(self, 
             key: str, 
@@ -23,6 +23,7 @@ from typing import Dict, Any, Optional, Callable, Union, List
 
 import json
 import os
+import pickle
 import shutil
 import yaml
 
@@ -475,6 +476,42 @@ class DefaultObjectStore(ObjectStore):
         with open(object_path, 'w') as f:
             json.dump(content, f)
 
+    def read_pickle(self, object_path: str) -> Any:
+        """Read a pickled object from the given path. Pickle files are only
+        used as a faster alternative for internal files that are written by
+        vizier itself. They must never be used for files from untrusted
+        sources.
+
+        Raises ValueError if no object with given path exists.
+
+        Parameters
+        ----------
+        object_path: string
+            Path identifier for a resource object
+
+        Returns
+        -------
+        any
+        """
+        try:
+            with open(object_path, 'rb') as f:
+                return pickle.load(f)
+        except IOError as ex:
+            raise ValueError(ex)
+
+    def write_pickle(self, object_path: str, content: Any) -> None:
+        """Write the pickled content to the given path.
+
+        Parameters
+        ----------
+        object_path: string
+            Path identifier for a resource object
+        content: any
+            Object that is pickled
+        """
+        with open(object_path, 'wb') as f:
+            pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+
 
 # ------------------------------------------------------------------------------
 # Helper Methods
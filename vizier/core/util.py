@@ -16,13 +16,19 @@
 
 """Collection of helper methods."""
 
-from typing import Any, TypeVar, Optional, IO
+from typing import Any, TypeVar, Optional, IO, Union
 
 import json
 import os
 import uuid
 from datetime import date, datetime
 
+# Use orjson for parsing Json documents if it is installed.
+try:
+    import orjson # type: ignore[import]
+except ImportError:
+    orjson = None # type: ignore[assignment]
+
 
 """Name of logger used for monitoring workflow engine performance."""
 LOGGER_ENGINE = 'LOGGER_ENGINE'
@@ -216,6 +222,51 @@ def load_json(jsonstr):
     return json.loads(jsonstr, object_hook=lambda d: vars(Namespace(**d)))
 
 
+def parse_json(content: Union[str, bytes]) -> Any:
+    """Parse a Json document that is given as a string or as raw bytes (e.g.,
+    the content of a HTTP response). Uses orjson if it is installed. Falls back
+    to the standard json parser for documents that orjson does not accept
+    (e.g., documents that contain NaN values).
+
+    Parameters
+    ----------
+    content: string or bytes
+        Serialized Json document
+
+    Returns
+    -------
+    any
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize an object as a Json document. Uses orjson if it is installed.
+    Falls back to the standard json encoder for objects that orjson cannot
+    serialize (e.g., integers that exceed 64 bit).
+
+    Parameters
+    ----------
+    obj: any
+        Json serializable object
+
+    Returns
+    -------
+    bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
 def min_max(values):
     """Return the min and the max value from a list of values.
 
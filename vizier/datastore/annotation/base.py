@@ -36,6 +36,8 @@ class DatasetCaveat(object):
     family: scalar, optional
         Opaque grouping key, used to associate sets of caveats together
     """
+    __slots__ = ('key', 'message', 'family')
+
     def __init__(self, 
             key: List[Any], 
             message: str, 
@@ -20,14 +20,20 @@ workflows.
 """
 
 from abc import abstractmethod
+from operator import attrgetter
 from typing import Optional, List, Dict, Any, Tuple
 
 import os
 from vizier.filestore.base import FileHandle
 from vizier.datastore.annotation.base import DatasetCaveat
 from vizier.datastore.dataset import DatasetRow, DatasetColumn, DatasetDescriptor, DatasetHandle
+# Column lookup helpers are also imported from this module
+from vizier.datastore.dataset import collabel_2_index, get_column_index # noqa: F401
 from pandas import DataFrame
 
+"""Accessor for the identifier of dataset columns and rows."""
+OBJECT_IDENTIFIER = attrgetter('identifier')
+
 """Metadata file name for datasets in the the default datastore."""
 METADATA_FILE = 'annotations.json'
 
@@ -429,92 +435,6 @@ class DefaultDatastore(Datastore):
 #
 # ------------------------------------------------------------------------------
 
-def collabel_2_index(label):
-    """Convert a column label into a column index (based at 0), e.g., 'A'-> 1,
-    'B' -> 2, ..., 'AA' -> 27, etc.
-
-    Returns -1 if the given labe is not composed only of upper case letters A-Z.
-    Parameters
-    ----------
-    label : string
-        Column label (expected to be composed of upper case letters A-Z)
-
-    Returns
-    -------
-    int
-    """
-    # The following code is adopted from
-    # https://stackoverflow.com/questions/7261936/convert-an-excel-or-spreadsheet-column-letter-to-its-number-in-pythonic-fashion
-    num = 0
-    for c in label:
-        if ord('A') <= ord(c) <= ord('Z'):
-            num = num * 26 + (ord(c) - ord('A')) + 1
-        else:
-            return -1
-    return num
-
-
-def get_column_index(columns, column_id):
-    """Get position of a column in a given column list. The column identifier
-    can either be of type int (i.e., the index position of the column in the
-    given list), or a string (either the column name or column label). If
-    column_id is of type string it is first assumed to be a column name.
-    Only if no column matches the column name or if multiple columns with
-    the given name exist will the value of column_id be interpreted as a
-    label.
-
-    Raises ValueError if column_id does not reference an existing column in
-    the dataset schema.
-
-    Parameters
-    ----------
-    columns: list(vizier.datastore.base.DatasetColumn)
-        List of columns in a dataset schema
-    column_id : int or string
-        Column index, name, or label
-
-    Returns
-    -------
-    int
-    """
-    if isinstance(column_id, int):
-        # Return column if it is a column index and withing the range of
-        # dataset columns
-        if column_id >= 0 and column_id < len(columns):
-            return column_id
-        raise ValueError('invalid column index \'' + str(column_id) + '\'')
-    elif isinstance(column_id, str):
-        # Get index for column that has a name that matches column_id. If
-        # multiple matches are detected column_id will be interpreted as a
-        # column label
-        name_index = -1
-        for i in range(len(columns)):
-            col_name = columns[i].name
-            if col_name.lower() == column_id.lower():
-                if name_index == -1:
-                    name_index = i
-                else:
-                    # Multiple columns with the same name exist. Signal that
-                    # no unique column was found by setting name_index to -1.
-                    name_index = -2
-                    break
-        if name_index < 0:
-            # Check whether column_id is a column label that is within the
-            # range of the dataset schema
-            label_index = collabel_2_index(column_id)
-            if label_index > 0:
-                if label_index <= len(columns):
-                    name_index = label_index - 1
-        # Return index of column with matching name or label if there exists
-        # a unique solution. Otherwise raise exception.
-        if name_index >= 0:
-            return name_index
-        elif name_index == -1:
-            raise ValueError('unknown column \'' + str(column_id) + '\'')
-        else:
-            raise ValueError('not a unique column name \'' + str(column_id) + '\'')
-
-
 def get_index_for_column(dataset: DatasetDescriptor, col_id: int):
     """Get index position for column with given id in dataset schema.
 
@@ -565,11 +485,7 @@ def max_object_id(objects):
     -------
     int
     """
-    max_id = -1
-    for obj in objects:
-        if obj.identifier > max_id:
-            max_id = obj.identifier
-    return max_id
+    return max(map(OBJECT_IDENTIFIER, objects), default=-1)
 
 def validate_schema(columns, rows):
     """Validate that the given set of rows contains exactly one value for each
@@ -577,7 +493,7 @@ def validate_schema(columns, rows):
 
     Raises ValueError in case of a schema violation.
     """
-    for i in range(len(rows)):
-        row = rows[i]
-        if len(row.values) != len(columns):
-            raise ValueError('schema violation for row \'' + str(i) + '\'')
+    n = len(columns)
+    invalid = next((i for i, row in enumerate(rows) if len(row.values) != n), -1)
+    if invalid != -1:
+        raise ValueError('schema violation for row \'' + str(invalid) + '\'')
@@ -20,7 +20,9 @@ workflows.
 """
 
 from abc import abstractmethod
-from typing import Optional, List, Any, Dict, TYPE_CHECKING
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, List, Any, Dict, Sequence, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from vizier.datastore.annotation.base import DatasetCaveat
     from vizier.datastore.reader import DatasetReader
@@ -50,6 +52,9 @@ COLUMN_DATATYPES = [
     DATATYPE_VARCHAR
 ]
 
+"""Character codes of the upper case letters A-Z that make up column labels."""
+LABEL_CHARACTERS = bytes(range(ord('A'), ord('Z') + 1))
+
 
 class DatasetColumn(object):
     """Column in a dataset. Each column has a unique identifier and a
@@ -66,6 +71,8 @@ class DatasetColumn(object):
         following data_type values are expected: date (format yyyy-MM-dd), int,
         varchar, real, and datetime (format yyyy-MM-dd hh:mm:ss:zzzz).
     """
+    __slots__ = ('identifier', 'name', 'data_type')
+
     def __init__(self, 
             identifier: int = -1, 
             name: Optional[str] = None, 
@@ -93,7 +100,7 @@ class DatasetColumn(object):
         string
         """
         name = self.name
-        if not self.data_type is None:
+        if self.data_type is not None:
             name += '(' + str(self.data_type) + ')'
         return name
 
@@ -133,8 +140,11 @@ class DatasetDescriptor(ArtifactDescriptor):
             artifact_type=ARTIFACT_TYPE_DATASET,
         )    
         self.identifier = identifier
-        self.columns = columns if not columns is None else list()
+        self.columns = columns if columns is not None else list()
         self.name = name
+        # Index of column positions by column identifier. The index is built
+        # on demand and rebuilt whenever it is out of sync with the schema.
+        self.column_positions: Dict[int, int] = dict()
 
     def column_by_id(self, 
             identifier: int
@@ -152,10 +162,10 @@ class DatasetDescriptor(ArtifactDescriptor):
         -------
         vizier.datastore.base.DatasetColumn
         """
-        for col in self.columns:
-            if col.identifier == identifier:
-                return col
-        raise ValueError('unknown column \'' + str(identifier) + '\'')
+        index = self.get_index(identifier)
+        if index is None:
+            raise ValueError('unknown column \'' + str(identifier) + '\'')
+        return self.columns[index]
 
     def column_by_name(self, name, ignore_case=True):
         """Returns the first column with a matching name. The result is None if
@@ -172,12 +182,10 @@ class DatasetDescriptor(ArtifactDescriptor):
         -------
         vizier.datastore.base.DatasetColumn
         """
-        for col in self.columns:
-            if ignore_case:
-                if name.upper() == col.name.upper():
-                    return col
-            elif name == col.name:
-                return col
+        if not ignore_case:
+            return next((c for c in self.columns if c.name == name), None)
+        key = name.upper()
+        return next((c for c in self.columns if c.name.upper() == key), None)
 
     def column_index(self, column_id):
         """Get position of a given column in the dataset schema. The given
@@ -215,10 +223,18 @@ class DatasetDescriptor(ArtifactDescriptor):
         -------
         int
         """
-        for i in range(len(self.columns)):
-            if self.columns[i].identifier == column_id:
-                return i
-        return None
+        index = self.column_positions.get(column_id)
+        if index is not None:
+            # Verify that the index is in sync with the schema since the list
+            # of columns may have been modified since the index was built.
+            if index < len(self.columns) and self.columns[index].identifier == column_id:
+                return index
+        # Rebuild the index. Keep the position of the first column if the
+        # schema contains duplicate identifiers.
+        self.column_positions = dict()
+        for i, col in enumerate(self.columns):
+            self.column_positions.setdefault(col.identifier, i)
+        return self.column_positions.get(column_id)
 
     def get_unique_name(self, name):
         """Get a unique version of the given column name. If no column with the
@@ -234,7 +250,7 @@ class DatasetDescriptor(ArtifactDescriptor):
         -------
         string
         """
-        names = [c.name.upper() for c in self.columns]
+        names = {c.name.upper() for c in self.columns}
         if not name.upper() in names:
             return name
         index = 1
@@ -252,10 +268,7 @@ class DatasetDescriptor(ArtifactDescriptor):
         -------
         int
         """
-        if len(self.columns) == 0:
-            return -1
-        else:
-            return max([col.identifier for col in self.columns])
+        return max((col.identifier for col in self.columns), default=-1)
 
     def print_schema(self, name):
         """Print dataset schema as a list of lines.
@@ -292,10 +305,12 @@ class DatasetRow(object):
     caveats: list(bool), optional
         Optional flags indicating whether row cells are annotated
     """
+    __slots__ = ('identifier', 'values', 'caveats')
+
     def __init__(self, 
             identifier: str = "-1", 
             values: Optional[List[Any]] = None, 
-            caveats: Optional[List[bool]] = None):
+            caveats: Optional[Sequence[bool]] = None):
         """Initialize the row object.
 
         Parameters
@@ -308,8 +323,9 @@ class DatasetRow(object):
             Optional flags indicating whether row cells are annotated
         """
         self.identifier = identifier
-        self.values: List[Any] = values if not values is None else list()
-        self.caveats: List[bool] = caveats if not caveats is None else [ False for v in self.values ]
+        self.values: List[Any] = values if values is not None else list()
+        # Rows without caveats share an immutable tuple of flags per row width
+        self.caveats: Sequence[bool] = caveats if caveats is not None else no_caveats(len(self.values))
 
     def __repr__(self):
         return "DatasetRow({}@< {} >)".format(self.identifier, ", ".join(str(v) for v in self.values))
@@ -387,18 +403,19 @@ class DatasetHandle(DatasetDescriptor):
         ------
         list(vizier.dataset.base.DatasetRow)
         """
-        # Return empty list for special case that limit is 0
         if offset < 0:
             raise Exception("Invalid Offset: {}".format(offset))
         if limit is not None and limit < 0:
             raise Exception("Invalid Limit: {}".format(limit))
-        # Collect rows in result list. Skip first rows if offset is greater than
-        # zero
-        rows:List[DatasetRow] = list()
+        # Return empty list for special case that limit is 0 without opening
+        # the reader
+        if limit == 0:
+            return list()
+        # Collect rows in result list. The reader skips the first rows if
+        # offset is greater than zero. Stop reading once limit rows have been
+        # collected in case the reader does not apply the limit itself.
         with self.reader(offset=offset, limit=limit) as reader:
-            for row in reader:
-                rows.append(row)
-        return rows
+            return list(islice(reader, limit))
 
     @abstractmethod
     def get_caveats(self, 
@@ -461,6 +478,7 @@ class DatasetHandle(DatasetDescriptor):
 #
 # ------------------------------------------------------------------------------
 
+@lru_cache(maxsize=256)
 def collabel_2_index(label):
     """Convert a column label into a column index (based at 0), e.g., 'A'-> 1,
     'B' -> 2, ..., 'AA' -> 27, etc.
@@ -477,15 +495,41 @@ def collabel_2_index(label):
     """
     # The following code is adopted from
     # https://stackoverflow.com/questions/7261936/convert-an-excel-or-spreadsheet-column-letter-to-its-number-in-pythonic-fashion
+    # Iterating over the encoded label yields the character codes directly.
+    # Deleting all valid characters leaves an empty string only if the label
+    # is composed of upper case letters. Results for recently used labels are
+    # cached.
+    try:
+        codes = label.encode('ascii')
+    except UnicodeEncodeError:
+        return -1
+    if codes.translate(None, LABEL_CHARACTERS):
+        return -1
     num = 0
-    for c in label:
-        if ord('A') <= ord(c) <= ord('Z'):
-            num = num * 26 + (ord(c) - ord('A')) + 1
-        else:
-            return -1
+    for c in codes:
+        # 64 = ord('A') - 1
+        num = num * 26 + c - 64
     return num
 
 
+@lru_cache(maxsize=64)
+def no_caveats(n: int) -> Tuple[bool, ...]:
+    """Get the cell caveat flags for a row with n values none of which are
+    annotated. The result is immutable and shared by all rows of the same
+    width.
+
+    Parameters
+    ----------
+    n: int
+        Number of values in the row
+
+    Returns
+    -------
+    tuple(bool)
+    """
+    return (False,) * n
+
+
 def get_column_index(columns, column_id):
     """Get position of a column in a given column list. The column identifier
     can either be of type int (i.e., the index position of the column in the
@@ -519,15 +563,15 @@ def get_column_index(columns, column_id):
         # Get index for column that has a name that matches column_id. If
         # multiple matches are detected column_id will be interpreted as a
         # column label
+        key = column_id.lower()
         name_index = -1
-        for i in range(len(columns)):
-            col_name = columns[i].name
-            if col_name.lower() == column_id.lower():
+        for i, col in enumerate(columns):
+            if col.name.lower() == key:
                 if name_index == -1:
                     name_index = i
                 else:
                     # Multiple columns with the same name exist. Signal that
-                    # no unique column was found by setting name_index to -1.
+                    # no unique column was found by setting name_index to -2.
                     name_index = -2
                     break
         if name_index < 0:
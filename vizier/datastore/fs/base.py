@@ -20,7 +20,6 @@ subfolder of a given base directory.
 """
 
 import csv
-import json
 import os
 import shutil
 import tempfile
@@ -29,7 +28,7 @@ import urllib.error
 import urllib.parse
 from typing import Tuple, List, Dict, Any, Optional
 
-from vizier.core.util import cast, get_unique_identifier
+from vizier.core.util import cast, get_unique_identifier, parse_json
 from vizier.datastore.base import DefaultDatastore
 from vizier.datastore.dataset import DatasetColumn, DatasetDescriptor
 from vizier.datastore.dataset import DatasetRow
@@ -97,20 +96,20 @@ class FileSystemDatastore(DefaultDatastore):
         # value per column.
         properties = {} if properties is None else properties
         dependencies = [] if dependencies is None else dependencies
-        identifiers = set(
-            int(row.identifier)
-            for row in rows 
-            if row.identifier is not None and int(row.identifier) >= 0
-        )
-        identifiers.add(0)
-        max_row_id = max(identifiers)
+        # Convert each row identifier only once. Rows without a valid
+        # identifier are assigned a new one.
+        row_ids = [
+            int(row.identifier) if row.identifier is not None else -1
+            for row in rows
+        ]
+        max_row_id = max(max(row_ids, default=0), 0)
         rows = [
             DatasetRow(
-                identifier = row.identifier if row.identifier is not None and int(row.identifier) >= 0 else str(idx + max_row_id),
+                identifier = row.identifier if row_id >= 0 else str(idx + max_row_id),
                 values = row.values,
                 caveats = row.caveats
             )
-            for idx, row in enumerate(rows)
+            for idx, (row, row_id) in enumerate(zip(rows, row_ids))
         ]
         _, max_row_id = validate_dataset(columns=columns, rows=rows)
         # Get new identifier and create directory for new dataset
@@ -145,8 +144,8 @@ class FileSystemDatastore(DefaultDatastore):
     def get_properties(self, identifier):
         properties_filename = self.get_properties_filename(identifier)
         if os.path.isfile(properties_filename):
-            with open(properties_filename, 'r') as f:
-                return json.loads(f.read())
+            with open(properties_filename, 'rb') as f:
+                return parse_json(f.read())
         else:
             return {}
 
@@ -199,7 +198,7 @@ class FileSystemDatastore(DefaultDatastore):
         vizier.datastore.fs.dataset.FileSystemDatasetHandle,
         vizier.filestore.base.FileHandle
         """
-        if not filestore is None:
+        if filestore is not None:
             # Upload the file to the filestore to get the file handle
             fh = filestore.download_file(
                 url=url,
@@ -440,12 +439,14 @@ def validate_dataset(columns: List[DatasetColumn], rows: List[DatasetRow]) -> Tu
     # Ensure that all row identifier are zero or greater, unique, smaller than
     # the row counter (if given), and contain exactly one value for each column
     row_ids = set()
+    n_columns = len(columns)
     for row in rows:
-        if len(row.values) != len(columns):
+        if len(row.values) != n_columns:
             raise ValueError('schema violation for row \'' + str(row.identifier) + '\'')
-        elif int(row.identifier) < 0:
+        row_id = int(row.identifier)
+        if row_id < 0:
             raise ValueError('negative row identifier \'' + str(row.identifier) + '\'')
-        elif int(row.identifier) in row_ids:
+        elif row_id in row_ids:
             raise ValueError('duplicate row identifier \'' + str(row.identifier) + '\'')
-        row_ids.add(int(row.identifier))
-    return max(col_ids) if len(col_ids) > 0 else -1, max(row_ids) if len(row_ids) > 0 else -1
+        row_ids.add(row_id)
+    return max(col_ids, default=-1), max(row_ids, default=-1)
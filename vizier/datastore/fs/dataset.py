@@ -28,8 +28,10 @@ the dataset schema.
 
 import json
 import os
+from operator import attrgetter, itemgetter
 from typing import List, Optional, Dict, Any
 
+from vizier.core.util import dumps_json, parse_json
 from vizier.datastore.dataset import DatasetColumn, DatasetHandle
 from vizier.datastore.annotation.base import DatasetCaveat
 from vizier.datastore.reader import DefaultJsonDatasetReader
@@ -44,6 +46,12 @@ KEY_COLUMNS = 'columns'
 KEY_ROWCOUNT = 'rowCount'
 KEY_MAXROWID = 'maxRowId'
 
+"""Getters for column components in the serialized and the object
+representation of dataset columns.
+"""
+COLUMN_VALUES = itemgetter(KEY_COLUMN_ID, KEY_COLUMN_NAME, KEY_COLUMN_TYPE)
+COLUMN_PROPERTIES = attrgetter('identifier', 'name', 'data_type')
+
 
 class FileSystemDatasetHandle(DatasetHandle):
     """Handle for a dataset that is stored on the file system.
@@ -65,7 +73,7 @@ class FileSystemDatasetHandle(DatasetHandle):
             max_row_id: int, 
             data_file: str, 
             row_count: int = 0,
-            properties: Dict[str, Any] = {}
+            properties: Optional[Dict[str, Any]] = None
     ):
         """Initialize the dataset handle.
 
@@ -89,7 +97,7 @@ class FileSystemDatasetHandle(DatasetHandle):
             columns=columns
         )
         self._row_count=row_count
-        self.properties = properties
+        self.properties = properties if properties is not None else dict()
         self.data_file = data_file
         if max_row_id is None:
             raise ValueError('invalid max')
@@ -117,21 +125,18 @@ class FileSystemDatasetHandle(DatasetHandle):
         -------
         vizier.datastore.fs.dataset.FileSystemDatasetHandle
         """
-        with open(descriptor_file, 'r') as f:
-            doc = json.loads(f.read())
+        with open(descriptor_file, 'rb') as f:
+            doc = parse_json(f.read())
         properties = {}
         if properties_filename is not None:
             if os.path.isfile(properties_filename):
-                with open(properties_filename, 'r') as f:
-                    properties = json.loads(f.read())
+                with open(properties_filename, 'rb') as f:
+                    properties = parse_json(f.read())
         return FileSystemDatasetHandle(
             identifier=doc[KEY_IDENTIFIER],
             columns=[
-                DatasetColumn(
-                    identifier=col[KEY_COLUMN_ID],
-                    name=col[KEY_COLUMN_NAME],
-                    data_type=col[KEY_COLUMN_TYPE]
-                ) for col in doc[KEY_COLUMNS]
+                DatasetColumn(col_id, col_name, col_type)
+                for col_id, col_name, col_type in map(COLUMN_VALUES, doc[KEY_COLUMNS])
             ],
             data_file=data_file,
             row_count=doc[KEY_ROWCOUNT],
@@ -210,12 +215,12 @@ class FileSystemDatasetHandle(DatasetHandle):
         doc = {
             KEY_IDENTIFIER: self.identifier,
             KEY_COLUMNS: [{
-                    KEY_COLUMN_ID: col.identifier,
-                    KEY_COLUMN_NAME: col.name,
-                    KEY_COLUMN_TYPE: col.data_type
-                } for col in self.columns],
+                    KEY_COLUMN_ID: col_id,
+                    KEY_COLUMN_NAME: col_name,
+                    KEY_COLUMN_TYPE: col_type
+                } for col_id, col_name, col_type in map(COLUMN_PROPERTIES, self.columns)],
             KEY_ROWCOUNT: self.row_count,
             KEY_MAXROWID: self._max_row_id
         }
-        with open(descriptor_file, 'w') as f:
-            json.dump(doc, f)
+        with open(descriptor_file, 'wb') as f:
+            f.write(dumps_json(doc))
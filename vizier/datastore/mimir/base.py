@@ -15,7 +15,7 @@
 # limitations under the License.
 
 """Declaration of constants and helper methods for the Mimir datastore."""
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Dict, TYPE_CHECKING
 if TYPE_CHECKING:
     from vizier.datastore.mimir.dataset import MimirDatasetColumn
 
@@ -193,21 +193,61 @@ def get_select_query(table_name, columns=None):
         return 'SELECT ' + col_list + ' FROM ' + table_name
     else:
         return 'SELECT ' + ROW_ID + ' FROM ' + table_name
-    
 
-def mimir_value_to_python(encoded: Any, column: "MimirDatasetColumn") -> Any:
-    if column.data_type == DATATYPE_DATE and type(encoded) is dict:
+
+def decode_date(encoded: Any) -> Any:
+    """Convert a date value in Mimir's dictionary encoding into a date object.
+    Other values are returned as is.
+
+    Parameters
+    ----------
+    encoded: any
+        Encoded cell value
+
+    Returns
+    -------
+    any
+    """
+    if type(encoded) is dict:
         return date(encoded["year"], encoded["month"], encoded["date"])
-    elif column.data_type == DATATYPE_DATETIME and type(encoded) is dict:
+    return encoded
+
+
+def decode_datetime(encoded: Any) -> Any:
+    """Convert a timestamp value in Mimir's dictionary encoding into a
+    datetime object. Other values are returned as is.
+
+    Parameters
+    ----------
+    encoded: any
+        Encoded cell value
+
+    Returns
+    -------
+    any
+    """
+    if type(encoded) is dict:
+        get = encoded.get
         return datetime(
                 encoded["year"], encoded["month"], encoded["date"],
-                encoded.get("hour", 0), 
-                encoded.get("min", 0), 
-                encoded.get("sec", 0), 
-                encoded.get("msec", 0)
+                get("hour", 0), 
+                get("min", 0), 
+                get("sec", 0), 
+                get("msec", 0)
             )
-    else:
-        return encoded
+    return encoded
+
+
+"""Decoders for values of data types that Mimir encodes as dictionaries."""
+VALUE_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    DATATYPE_DATE: decode_date,
+    DATATYPE_DATETIME: decode_datetime
+}
+
+
+def mimir_value_to_python(encoded: Any, column: "MimirDatasetColumn") -> Any:
+    decoder = VALUE_DECODERS.get(column.data_type)
+    return decoder(encoded) if decoder is not None else encoded
 
 
 def sanitize_column_name(name: str) -> str:
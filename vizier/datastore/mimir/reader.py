@@ -118,19 +118,27 @@ class MimirDatasetReader(DatasetReader):
             # Initialize mapping of column rdb names to index positions in
             # dataset rows
             rs_rows = rs['data']
-            row_ids = rs['prov']
             annotation_flags = rs['colTaint']
+            # Get the value decoder for each column once. Only the positions of
+            # columns that need decoding are visited for each row.
+            n_columns = len(self.columns)
+            decoders = [
+                (i, decoder)
+                for i, decoder in enumerate(
+                    base.VALUE_DECODERS.get(col.data_type) for col in self.columns
+                )
+                if decoder is not None
+            ]
             self.rows = list()
-            for row_index in range(len(rs_rows)):
-                row = rs_rows[row_index]
-                row_annotation_flags = annotation_flags[row_index]  
-                row_id = str(row_ids[row_index])
-                values = [None] * len(self.columns)
-                annotation_flag_values: List[bool] = [False] * len(self.columns)
-                for i in range(len(self.columns)):
-                    col = self.columns[i]
-                    values[i] = base.mimir_value_to_python(row[i], col)
-                    annotation_flag_values[i] = not row_annotation_flags[i]
+            # Row identifiers are converted to strings in bulk
+            row_ids = map(str, rs['prov'])
+            for row, row_id, row_annotation_flags in zip(rs_rows, row_ids, annotation_flags):
+                values = list(row[:n_columns])
+                for i, decoder in decoders:
+                    values[i] = decoder(values[i])
+                annotation_flag_values: List[bool] = [
+                    not flag for flag in row_annotation_flags[:n_columns]
+                ]
                 self.rows.append(DatasetRow(row_id, values, annotation_flag_values))
             self.read_index = 0
             self.is_open = True
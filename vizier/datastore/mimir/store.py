@@ -158,9 +158,12 @@ class MimirDatastore(DefaultDatastore):
         results = list(_load_from_socket((portSecret['port'], portSecret['secret']), ArrowCollectSerializer()))
         batches = results[:-1]
         batch_order = results[-1]
-        ordered_batches = [batches[i] for i in batch_order]
-        table = pa.Table.from_batches(ordered_batches)
-        return table.to_pandas()
+        table = pa.Table.from_batches([batches[i] for i in batch_order])
+        # Drop the remaining references to the record batches so that the
+        # conversion can release each column's Arrow buffers as soon as it has
+        # been copied into the data frame.
+        del results, batches
+        return table.to_pandas(split_blocks=True, self_destruct=True)
       
     def get_caveats(self, 
             identifier: str, 
@@ -25,17 +25,35 @@ import csv
 import gzip
 import json
 from io import TextIOWrapper
-from typing import cast, List, Optional, IO
+from itertools import islice
+from typing import cast, Any, Dict, List, Optional, IO
 
+from vizier.core.util import parse_json
 from vizier.datastore.dataset import DatasetRow
 from vizier.datastore.base import DatasetColumn
 
+# Use ijson for streaming the rows of Json dataset files if it is installed.
+try:
+    import ijson # type: ignore[import]
+except ImportError:
+    ijson = None # type: ignore[assignment]
+
 """Json element names for default dataset serialization."""
 KEY_ROWS = 'rows'
 KEY_ROW_ID = 'id'
 KEY_ROW_VALUES = 'val'
 
 
+class DatasetRowEncoder(json.JSONEncoder):
+    """Json encoder that serializes dataset rows in the default Json format
+    for dataset files.
+    """
+    def default(self, obj):
+        if isinstance(obj, DatasetRow):
+            return {KEY_ROW_ID: obj.identifier, KEY_ROW_VALUES: obj.values}
+        return super(DatasetRowEncoder, self).default(obj)
+
+
 class DatasetReader(object):
     """Reader for datasets. Allows to iterate over the the rows in a dataset.
     Rows are lists of values, one for each column.
@@ -280,23 +298,11 @@ class DefaultJsonDatasetReader(DatasetReader):
             if self.compressed:
                 self.fh = gzip.open(self.filename, 'rb')
             else:
-                self.fh = open(self.filename, 'r')
-            # Read the Json file and get the array of rows. Depending on whether
+                self.fh = open(self.filename, 'rb')
+            # Read the array of rows from the Json file. Depending on whether
             # offset or limit arguments were given we may select only a subset
             # of the rows in the file.
-            ds_rows = json.loads(self.fh.read())[KEY_ROWS]
-            if self.offset > 0 or self.limit is not None:
-                self.rows = list()
-                skip = self.offset
-                for row in ds_rows:
-                    if skip > 0:
-                        skip -= 1
-                    else:
-                        self.rows.append(row)
-                        if self.limit is not None and len(self.rows) >= self.limit:
-                            break
-            else:
-                self.rows = ds_rows
+            self.rows = read_json_rows(self.fh, self.offset, self.limit)
             self.read_index = 0
             self.is_open = True
         return self
@@ -315,15 +321,9 @@ class DefaultJsonDatasetReader(DatasetReader):
         else:
             fh = open(self.filename, 'w')
 
-        # Write dataset rows
-        json.dump({
-                KEY_ROWS: [{
-                    KEY_ROW_ID: row.identifier,
-                    KEY_ROW_VALUES: row.values
-                } for row in rows]
-            },
-            fh
-        )
+        # Write dataset rows. The encoder serializes each row as it is written
+        # instead of creating a list with dictionaries for all rows first.
+        json.dump({KEY_ROWS: rows}, fh, cls=DatasetRowEncoder)
         fh.close()
 
 
@@ -381,3 +381,43 @@ class InMemDatasetReader(DatasetReader):
             self.read_index = 0
             self.is_open = True
         return self
+
+
+# ------------------------------------------------------------------------------
+# Helper Methods
+# ------------------------------------------------------------------------------
+
+def read_json_rows(
+        fh: IO, 
+        offset: int = 0, 
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+    """Read the list of rows (in original Json format) from a dataset file in
+    default Json format. If ijson is installed the rows are streamed from the
+    file and parsing stops once the requested range of rows has been read,
+    i.e., the full document is never held in memory. Falls back to parsing the
+    full document for files that ijson cannot read (e.g., that contain NaN
+    values). A negative or missing limit returns all rows after the offset.
+
+    Parameters
+    ----------
+    fh: file object
+        Binary file handle positioned at the start of the document
+    offset: int, optional
+        Number of rows at the beginning of the list that are skipped.
+    limit: int, optional
+        Limits the number of rows that are returned.
+
+    Returns
+    -------
+    list(dict)
+    """
+    offset = max(offset, 0)
+    stop = offset + limit if limit is not None and limit >= 0 else None
+    if ijson is not None:
+        try:
+            items = ijson.items(fh, KEY_ROWS + '.item', use_float=True)
+            return list(islice(items, offset, stop))
+        except ijson.JSONError:
+            fh.seek(0)
+    return parse_json(fh.read())[KEY_ROWS][offset:stop]
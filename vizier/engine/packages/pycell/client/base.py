@@ -21,16 +21,23 @@ a datastore from within a python script.
 from typing import Callable, Tuple, Optional, Dict, Set, List, Any
 
 from vizier.core.util import is_valid_name
-from vizier.datastore.dataset import DatasetColumn
+from vizier.datastore.dataset import DatasetColumn, DatasetHandle
 from vizier.datastore.artifact import ArtifactDescriptor, ARTIFACT_TYPE_PYTHON
 from vizier.engine.packages.pycell.client.dataset import DatasetClient
 from vizier.viztrail.module.output import OutputObject, DatasetOutput, HtmlOutput, TextOutput
 from vizier.viztrail.module.output import OUTPUT_TEXT
 import os
 import re
+import sys
 import ast
-import astor # type: ignore[import]
+# Use the standard library unparser (Python 3.9+) to generate the source of
+# exported symbols if it is available.
+try:
+    from ast import unparse as to_source # type: ignore[attr-defined]
+except ImportError:
+    from astor import to_source # type: ignore[import]
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 from minio import Minio # type: ignore[import]
 from minio.error import ResponseError # type: ignore[import]
 # 2020-08-11 by OK: The following options are never used
@@ -43,6 +50,17 @@ from matplotlib.axes import Axes as MatplotlibAxes # type: ignore[import]
 from vizier.engine.packages.pycell.plugins import vizier_bokeh_render, vizier_matplotlib_render
 from vizier.datastore.base import Datastore
 from vizier.datastore.dataset import DatasetDescriptor
+
+
+"""Maximum number of concurrent datastore requests when resolving the read
+dependencies of an updated dataset."""
+MAX_DEPENDENCY_FETCH_WORKERS = 8
+
+"""Types of literal values whose repr is valid Python source."""
+LITERAL_TYPES = frozenset([bool, int, str, type(None)])
+
+"""Syntax tree nodes for exportable function and class definitions."""
+DEFINITION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
         
     
 class VizierDBClient(object):
@@ -79,6 +97,13 @@ class VizierDBClient(object):
         self.datasets = dict(datasets)
         self.dataobjects = dict(dataobjects)
         self.source = source
+        # Parsed syntax tree of the cell source. The tree is created on the
+        # first export and re-used as long as the source does not change.
+        self.source_ast: Optional[ast.Module] = None
+        self.source_ast_of: Optional[str] = None
+        # Index of the symbols that are defined in the source syntax tree
+        self.symbol_index: Optional[SymbolIndex] = None
+        self.symbol_index_of: Optional[ast.Module] = None
         # Keep track of datasets that are read and written, deleted and renamed.
         self.read: Set[str] = set()
         self.write: Set[str] = set()
@@ -106,15 +131,15 @@ class VizierDBClient(object):
         elif callable(exp):
             exp_name = exp.__name__
         else:
-            # If its a variable we grab the original name from the stack 
-            lcls = inspect.stack()[1][0].f_locals
-            for name in lcls:
-                if lcls[name] == exp:
-                    exp_name = name
-        src_ast = ast.parse(self.source)
-        analyzer = Analyzer(exp_name)
-        analyzer.visit(src_ast)
-        src = analyzer.get_Source()
+            # If its a variable we grab the original name from the calling
+            # frame. Compare by identity to avoid rich comparisons of values
+            # (e.g., data frames).
+            lcls = sys._getframe(1).f_locals
+            names = [name for name, value in lcls.items() if value is exp]
+            if not names:
+                raise ValueError('unable to determine name of exported variable')
+            exp_name = names[-1]
+        src = self.get_symbol_index().get_source(exp_name)
         if return_type is not None:
             if type(return_type) is type:
                 if return_type is int:
@@ -135,6 +160,33 @@ class VizierDBClient(object):
         self.dataobjects[exp_name] = descriptor
         self.write.add(exp_name)
         
+    def get_source_ast(self) -> ast.Module:
+        """Get the parsed syntax tree for the cell source. The tree is only
+        created once for each version of the source.
+
+        Returns
+        -------
+        ast.Module
+        """
+        if self.source_ast is None or self.source_ast_of is not self.source:
+            self.source_ast = ast.parse(self.source)
+            self.source_ast_of = self.source
+        return self.source_ast
+
+    def get_symbol_index(self) -> "SymbolIndex":
+        """Get the index of symbols that are defined in the cell source. The
+        index is only built once for each version of the source.
+
+        Returns
+        -------
+        vizier.engine.packages.pycell.client.base.SymbolIndex
+        """
+        tree = self.get_source_ast()
+        if self.symbol_index is None or self.symbol_index_of is not tree:
+            self.symbol_index = SymbolIndex(tree)
+            self.symbol_index_of = tree
+        return self.symbol_index
+
     def get_dataobject_identifier(self, name):
         """Returns the unique identifier for the dataset with the given name.
 
@@ -186,8 +238,10 @@ class VizierDBClient(object):
         vizier.datastore.client.DatasetClient
         """
         # Raise an exception if a dataset with the given name already exists or
-        # if the name is not valid
-        if name.lower() in self.datasets:
+        # if the name is not valid. Dataset names are interned so that the
+        # read/write tracking sets can match repeated accesses by identity.
+        key = sys.intern(name.lower())
+        if key in self.datasets:
             # Record access to the datasets
             raise ValueError('dataset \'' + name + '\' already exists')
         if not is_valid_name(name):
@@ -195,19 +249,21 @@ class VizierDBClient(object):
         # Create list of columns for new dataset. Ensure that every column has
         # a positive identifier
         columns = list()
-        if len(dataset.columns) > 0:
-            column_counter = max(max([col.identifier for col in dataset.columns]) + 1, 0)
-            for col in dataset.columns:
-                if col.identifier < 0:
-                    col.identifier = column_counter
-                    column_counter += 1
-                columns.append(
-                    DatasetColumn(
-                        identifier=col.identifier,
-                        name=col.name,
-                        data_type=col.data_type
-                    )
+        column_counter = max(
+            max((col.identifier for col in dataset.columns), default=-1) + 1,
+            0
+        )
+        for col in dataset.columns:
+            if col.identifier < 0:
+                col.identifier = column_counter
+                column_counter += 1
+            columns.append(
+                DatasetColumn(
+                    identifier=col.identifier,
+                    name=col.name,
+                    data_type=col.data_type
                 )
+            )
         rows = dataset.rows
         # Write dataset to datastore and add new dataset to context
         ds = self.datastore.create_dataset(
@@ -217,12 +273,16 @@ class VizierDBClient(object):
             human_readable_name=name,
             backend_options=backend_options
         )
-        self.datasets[name.lower()] = ds
-        self.write.add(name.lower())
+        self.datasets[key] = ds
+        self.write.add(key)
+        # Avoid reading the dataset back from the datastore if the store
+        # already returned a full handle for the new dataset.
+        handle = ds if isinstance(ds, DatasetHandle) \
+            else self.datastore.get_dataset(ds.identifier)
         return DatasetClient(
-            dataset = self.datastore.get_dataset(ds.identifier),
+            dataset = handle,
             client = self,
-            existing_name = name.lower()
+            existing_name = key
         )
 
     def drop_dataset(self, name):
@@ -237,13 +297,14 @@ class VizierDBClient(object):
         """
         # Make sure to record access idependently of whether the dataset exists
         # or not. Ignore read access to datasets that have been written.
-        if not name.lower() in self.write:
-            self.read.add(name.lower())
+        key = sys.intern(name.lower())
+        if not key in self.write:
+            self.read.add(key)
         # Remove the context dataset identifier for the given name. Will raise
         # a ValueError if dataset does not exist
         if self.delete is None:
             self.delete = set()
-        self.delete.add(name.lower())
+        self.delete.add(key)
         self.remove_dataset_identifier(name)
 
     def get_dataset(self, name):
@@ -262,8 +323,9 @@ class VizierDBClient(object):
         """
         # Make sure to record access idependently of whether the dataset exists
         # or not. Ignore read access to datasets that have been written.
-        if not name.lower() in self.write:
-            self.read.add(name.lower())
+        key = sys.intern(name.lower())
+        if not key in self.write:
+            self.read.add(key)
         # Get identifier for the dataset with the given name. Will raise an
         # exception if the name is unknown
         identifier = self.get_dataset_identifier(name)
@@ -274,7 +336,7 @@ class VizierDBClient(object):
         return DatasetClient(
             dataset = dataset,
             client = self,
-            existing_name = name.lower()
+            existing_name = key
         )
 
     def get_dataset_identifier(self, name: str) -> str:
@@ -355,22 +417,24 @@ class VizierDBClient(object):
         """
         # Make sure to record access idependently of whether the dataset exists
         # or not. Ignore read access to datasets that have been written.
-        if not name.lower() in self.write:
-            self.read.add(name.lower())
+        key = sys.intern(name.lower())
+        if not key in self.write:
+            self.read.add(key)
         # Add the new name to the written datasets
-        self.write.add(new_name.lower())
+        new_key = sys.intern(new_name.lower())
+        self.write.add(new_key)
         # Raise exception if new_name exists or is not valid.
-        if self.has_dataset_identifier(new_name.lower()):
-            raise ValueError('dataset \'{}\' exists'.format(new_name.lower()))
+        if new_key in self.datasets:
+            raise ValueError('dataset \'{}\' exists'.format(new_key))
         if not is_valid_name(new_name):
             raise ValueError('invalid dataset name \'{}\''.format(new_name))
         # Raise an exception if no dataset with the given name exists
-        ds = self.datasets.get(name.lower(), None)
+        ds = self.datasets.get(key, None)
         if ds is None:
             raise ValueError('dataset \'{}\' does not exist'.format(name))
-        self.drop_dataset(name.lower())
-        self.datasets[new_name.lower()] = ds
-        self.write.add(new_name.lower())
+        self.drop_dataset(key)
+        self.datasets[new_key] = ds
+        self.write.add(new_key)
 
 
     def update_dataset(self, 
@@ -394,12 +458,13 @@ class VizierDBClient(object):
         """
         # Get identifier for the dataset with the given name. Will raise an
         # exception if the name is unknown
+        key = sys.intern(name.lower())
         identifier = self.get_dataset_identifier(name)
         # Read dataset from datastore to get the column and row counter.
         source_dataset = self.datastore.get_dataset(identifier)
         if source_dataset is None:
             # Record access to the datasets
-            self.read.add(name.lower())
+            self.read.add(key)
             raise ValueError('unknown dataset \'' + identifier + '\'')
         column_counter = source_dataset.max_column_id() + 1
         # Update column and row identifier
@@ -415,14 +480,22 @@ class VizierDBClient(object):
         # so that we can at least track coarse grained provenance.
         # TODO: we are asumming mimir dataset and datastore 
         #       here and need to generalize this
-        read_dep = []
+        dept_ids = list()
         for dept_name in self.read:
             if not isinstance(dept_name, str):
                 raise RuntimeError('invalid read name')
-            dept_id = self.get_dataset_identifier(dept_name)
-            dept_dataset = self.datastore.get_dataset(dept_id)
-            if dept_dataset is not None:
-                read_dep.append(dept_dataset.identifier)
+            dept_ids.append(self.get_dataset_identifier(dept_name))
+        # Fetch the dependencies concurrently to overlap the datastore
+        # round-trips.
+        if len(dept_ids) > 1:
+            workers = min(len(dept_ids), MAX_DEPENDENCY_FETCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                dept_datasets = list(
+                    executor.map(self.datastore.get_dataset, dept_ids)
+                )
+        else:
+            dept_datasets = [self.datastore.get_dataset(i) for i in dept_ids]
+        read_dep = [d.identifier for d in dept_datasets if d is not None]
         ds = self.datastore.create_dataset(
             columns=columns,
             rows=rows,
@@ -430,12 +503,16 @@ class VizierDBClient(object):
             human_readable_name=name,
             dependencies=read_dep
         )
-        self.datasets[name.lower()] = ds
-        self.write.add(name.lower())
+        self.datasets[key] = ds
+        self.write.add(key)
+        # Avoid reading the dataset back from the datastore if the store
+        # already returned a full handle for the new dataset.
+        handle = ds if isinstance(ds, DatasetHandle) \
+            else self.datastore.get_dataset(ds.identifier)
         return DatasetClient(
-            dataset = self.datastore.get_dataset(ds.identifier),
+            dataset = handle,
             client = self,
-            existing_name = name.lower()
+            existing_name = key
         )
         
     def get_dataset_frame(self, name):
@@ -454,8 +531,9 @@ class VizierDBClient(object):
         """
         # Make sure to record access idependently of whether the dataset exists
         # or not. Ignore read access to datasets that have been written.
-        if not name.lower() in self.write:
-            self.read.add(name.lower())
+        key = sys.intern(name.lower())
+        if not key in self.write:
+            self.read.add(key)
         # Get identifier for the dataset with the given name. Will raise an
         # exception if the name is unknown
         identifier = self.get_dataset_identifier(name)
@@ -575,53 +653,62 @@ class VizierDBClient(object):
     def show_html(self, value):
         self.show(HtmlOutput(value))
     
-class Analyzer(ast.NodeVisitor):
-    def __init__(self, name):
-        self.name = name
-        self.source = ''
-        # track context name and set of names marked as `global`
-        self.context = [('global', ())]
-
-    def visit_FunctionDef(self, node):
-        self.context.append(('function', set()))
-        if node.name == self.name:
-            self.source = "@vizierdb.export_module_decorator\n" + astor.to_source(node)
-            self.generic_visit(node)
-        self.context.pop()
-
-    # treat coroutines the same way
-    visit_AsyncFunctionDef = visit_FunctionDef
-
-    def visit_Assign(self, node):
-        self.context.append(('assignment', set()))
-        target = node.targets[0]
-        if target.id == self.name:
-            self.source = "{} = vizierdb.wrap_variable({}, '{}')".format( self.name, astor.to_source(node.value), self.name)
-            self.generic_visit(target)
-        self.context.pop()
-        
-    def visit_ClassDef(self, node):
-        self.context.append(('class', ()))
-        if node.name == self.name:
-            self.source = "@vizierdb.export_module_decorator\n" + astor.to_source(node)
-            self.generic_visit(node)
-        self.context.pop()
-
-    def visit_Lambda(self, node):
-        # lambdas are just functions, albeit with no statements, so no assignments
-        self.context.append(('function', ()))
-        self.generic_visit(node)
-        self.context.pop()
-
-    def visit_Global(self, node):
-        assert self.context[-1][0] == 'function'
-        self.context[-1][1].update(node.names)
-
-    def visit_Name(self, node):
-        ctx, g = self.context[-1]
-        if node.id == self.name and (ctx == 'global' or node.id in g):
-            print('exported {} at line {} of {}'.format(node.id, node.lineno, self.source))
-            
-    def get_Source(self):
-        return self.source
-    
\ No newline at end of file
+class SymbolIndex(object):
+    """Index of the definitions of exportable symbols (functions, classes, and
+    variables) in a cell source. The syntax tree is scanned once for all
+    symbols. If a name is defined multiple times the last definition is kept.
+    The bodies of functions and classes are not scanned.
+    """
+    def __init__(self, tree: ast.AST):
+        """Build the index for the given syntax tree.
+
+        Parameters
+        ----------
+        tree: ast.AST
+            Syntax tree for the cell source
+        """
+        self.symbols: Dict[str, ast.AST] = dict()
+        # Iterative pre-order traversal in source order. Expressions cannot
+        # contain definitions, so their subtrees are skipped.
+        nodes: List[ast.AST] = [tree]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, DEFINITION_TYPES):
+                self.symbols[node.name] = node
+            elif isinstance(node, ast.Assign):
+                target = node.targets[0]
+                if isinstance(target, ast.Name):
+                    self.symbols[target.id] = node
+            else:
+                children = [
+                    child for child in ast.iter_child_nodes(node)
+                    if not isinstance(child, ast.expr)
+                ]
+                children.reverse()
+                nodes.extend(children)
+
+    def get_source(self, name: str) -> str:
+        """Get the source for exporting the symbol with the given name. The
+        result is an empty string if the symbol is not defined in the cell.
+
+        Parameters
+        ----------
+        name: string
+            Name of the exported symbol
+
+        Returns
+        -------
+        string
+        """
+        node = self.symbols.get(name)
+        if node is None:
+            return ''
+        elif isinstance(node, ast.Assign):
+            value = node.value
+            # Exported literals do not need to be unparsed
+            if isinstance(value, ast.Constant) and type(value.value) in LITERAL_TYPES:
+                value_source = repr(value.value)
+            else:
+                value_source = to_source(value)
+            return "{} = vizierdb.wrap_variable({}, '{}')".format(name, value_source, name)
+        return "@vizierdb.export_module_decorator\n" + to_source(node)
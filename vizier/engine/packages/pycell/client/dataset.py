@@ -17,6 +17,7 @@
 """Classes to manipulate vizier datasets from within the Python workflow cell.
 """
 
+from collections import OrderedDict
 from typing import Optional, TYPE_CHECKING, Dict, Any, List
 if TYPE_CHECKING:
     from vizier.engine.packages.pycell.client.base import VizierDBClient
@@ -25,6 +26,13 @@ from vizier.datastore.dataset import DatasetColumn, DatasetRow, get_column_index
 from bokeh.models.sources import ColumnDataSource # type: ignore[import]
 
 
+"""Number of rows that are fetched at once when individual cells are read
+before the dataset rows have been loaded."""
+ROW_PAGE_SIZE = 1000
+"""Maximum number of row pages that are kept for reading individual cells."""
+MAX_ROW_PAGES = 10
+
+
 class DatasetClient(object):
     """Client to interact with a Vizier dataset from within a Python workflow
     cell. Provides access to the columns and rows. Allows to insert and delete
@@ -63,7 +71,9 @@ class DatasetClient(object):
         self.existing_name = existing_name
         if dataset is not None:
             self.identifier: Optional[str] = dataset.identifier
-            self.columns = dataset.columns
+            # Copy the schema so that column operations do not modify the
+            # dataset handle
+            self.columns = list(dataset.columns)
             # Delay fetching rows and dataset annotations for now
             self._properties: Optional[Dict[str, Any]] = None
             self._rows: Optional[List[DatasetRow]] = None
@@ -72,6 +82,9 @@ class DatasetClient(object):
             self.columns = list()
             self._properties = {}
             self._rows = list()
+        # Recently used pages of rows for get_cell() while the dataset rows
+        # have not been loaded. Pages are kept in order of last access.
+        self._row_pages: "OrderedDict[int, List[DatasetRow]]" = OrderedDict()
 
     def __getitem__(self, key):
         return self.get_column(key)
@@ -117,7 +130,15 @@ class DatasetClient(object):
         -------
         int
         """
-        return get_column_index(self.columns, column_id)
+        columns = self.columns
+        if type(column_id) is int:
+            # Valid index positions are returned as is. Invalid positions are
+            # reported by get_column_index.
+            if 0 <= column_id < len(columns):
+                return column_id
+        # Column names and labels are resolved through the shared name index
+        # for the current schema
+        return get_column_index(columns, column_id)
 
     def delete_column(self, name):
         """Delete column from the dataset.
@@ -151,10 +172,7 @@ class DatasetClient(object):
         -------
         vizier.datastore.dataset.DatasetColumn
         """
-        for col in self.columns:
-            if col.name == name:
-                return col
-        return None
+        return next((col for col in self.columns if col.name == name), None)
 
     def insert_column(self, 
         name: str, 
@@ -175,7 +193,6 @@ class DatasetClient(object):
         DatasetColumn
         """
         column = DatasetColumn(name=name, data_type = data_type)
-        self.columns = list(self.columns)
         if not position is None:
             self.columns.insert(position, column)
             # Add a null value to each row for the new column
@@ -246,7 +263,28 @@ class DatasetClient(object):
         -------
         string
         """
-        if row < 0 or row > len(self.rows):
+        if row < 0:
+            raise ValueError('unknown row \'' + str(row) + '\'')
+        if self._rows is None and self.dataset is not None:
+            # Read from the page that contains the requested row if the
+            # dataset rows have not been loaded yet. The schema cannot have
+            # been modified in this case.
+            page_index, page_pos = divmod(row, ROW_PAGE_SIZE)
+            page = self._row_pages.get(page_index)
+            if page is None:
+                page = self.dataset.fetch_rows(
+                    offset=page_index * ROW_PAGE_SIZE,
+                    limit=ROW_PAGE_SIZE
+                )
+                self._row_pages[page_index] = page
+                if len(self._row_pages) > MAX_ROW_PAGES:
+                    self._row_pages.popitem(last=False)
+            else:
+                self._row_pages.move_to_end(page_index)
+            if page_pos >= len(page):
+                raise ValueError('unknown row \'' + str(row) + '\'')
+            return page[page_pos].values[self.column_index(column)]
+        if row >= len(self.rows):
             raise ValueError('unknown row \'' + str(row) + '\'')
         return self.rows[row].get_value(column)
 
@@ -284,17 +322,18 @@ class DatasetClient(object):
         list(vizier.datastore.client.MutableDatasetRow)
         """
         if self._rows is None:
-            self._rows = list()
-            for row in self.dataset.fetch_rows():
-                # Create mutable dataset row and set reference to this dataset
-                # for updates
-                self._rows.append(
-                    MutableDatasetRow(
-                        identifier=row.identifier,
-                        values=row.values,
-                        dataset=self
-                    )
+            # Create mutable dataset rows and set reference to this dataset
+            # for updates
+            self._rows = [
+                MutableDatasetRow(
+                    identifier=row.identifier,
+                    values=row.values,
+                    dataset=self
                 )
+                for row in self.dataset.fetch_rows()
+            ]
+            # Pages fetched by get_cell() are no longer used
+            self._row_pages.clear()
         return self._rows
 
     def to_bokeh(self, columns = None):
@@ -310,15 +349,17 @@ class DatasetClient(object):
         bokeh.models.sources.ColumnDataSource  
         """
 
+        # Resolve the position of each included column once. Only the values
+        # of the included columns are collected.
         if columns is None:
-            columns = self.columns
-        return ColumnDataSource(dict([
-            (
-                column.name, 
-                [ row.get_value(column.identifier if column.identifier >= 0 else column.name) for row in self.rows ]
-            )
-            for column in self.columns
-        ]))
+            positions = list(range(len(self.columns)))
+        else:
+            positions = [self.column_index(column) for column in columns]
+        rows = self.rows
+        return ColumnDataSource({
+            self.columns[pos].name: [row.values[pos] for row in rows]
+            for pos in positions
+        })
         
     def show_map(self, lat_col, lon_col, label_col=None, center_lat=None, center_lon=None, zoom=8, height="500", map_provider='OSM'):
         import numpy as np # type: ignore[import]
@@ -326,16 +367,20 @@ class DatasetClient(object):
         addrpts = list()
         lats = []
         lons = []
+        # Resolve the column positions once instead of for every row
+        lon_idx = self.column_index(lon_col)
+        lat_idx = self.column_index(lat_col)
+        label_idx = self.column_index(label_col) if label_col is not None else None
         for row in self.rows:
-            lon, lat = float(row.get_value(lon_col)), float(row.get_value(lat_col))  
+            lon, lat = float(row.values[lon_idx]), float(row.values[lat_idx])
             lats.append(lat) 
             lons.append(lon)
             if map_provider == 'Google':
                 addrpts.append({"lat":str(lat), "lng":str(lon)})
             elif map_provider == 'OSM':
                 label = ''
-                if not label_col is None:
-                    label = str(row.get_value(label_col))
+                if label_idx is not None:
+                    label = str(row.values[label_idx])
                 rowstr = '[' + str(lat) + ', ' + \
                              str(lon) + ', \'' + \
                              label + '\']'
@@ -426,6 +471,8 @@ class MutableDatasetRow(DatasetRow):
     values : list(string)
         List of column values in the row
     """
+    __slots__ = ('dataset',)
+
     def __init__(self, 
         identifier: Optional[str] = None, 
         values: Optional[List[Any]] = None, 
@@ -521,6 +568,9 @@ class ObjectMetadataSet(object):
             List of resource annotations
         """
         self.annotations = annotations
+        # Index of annotations by their key. The index is built on the first
+        # lookup by key.
+        self.key_index = None
 
     def contains(self, key):
         """Test if an annotation with given key exists for the resource.
@@ -534,7 +584,9 @@ class ObjectMetadataSet(object):
         -------
         bool
         """
-        return not self.find_one(key) is None
+        if self.key_index is not None:
+            return key in self.key_index
+        return any(anno.key == key for anno in self.annotations)
 
     def count(self):
         """Number of annotations for this resource.
@@ -558,11 +610,7 @@ class ObjectMetadataSet(object):
         -------
         list(vizier.datastore.annotation.base.DatasetAnnotation)
         """
-        result = list()
-        for anno in self.annotations:
-            if anno.key == key:
-                result.append(anno)
-        return result
+        return list(self.get_key_index().get(key, ()))
 
     def find_one(self, key):
         """Find the first annotation with given key. Returns None if no
@@ -577,9 +625,12 @@ class ObjectMetadataSet(object):
         -------
         vizier.datastore.annotation.base.DatasetAnnotation
         """
-        for anno in self.annotations:
-            if anno.key == key:
-                return anno
+        # Use the key index if it has been built by a previous call to
+        # find_all() or keys(). Otherwise, stop scanning at the first match.
+        if self.key_index is not None:
+            matches = self.key_index.get(key)
+            return matches[0] if matches else None
+        return next((anno for anno in self.annotations if anno.key == key), None)
 
     def keys(self):
         """List of existing annotation keys for the object.
@@ -588,7 +639,19 @@ class ObjectMetadataSet(object):
         -------
         list(string)
         """
-        result = set()
-        for anno in self.annotations:
-            result.add(anno.key)
-        return list(result)
+        return list(self.get_key_index())
+
+    def get_key_index(self):
+        """Get the index of annotations by their key. The index is built on
+        the first call and kept for subsequent lookups since the list of
+        annotations is not modified.
+
+        Returns
+        -------
+        dict(string: list(vizier.datastore.annotation.base.DatasetAnnotation))
+        """
+        if self.key_index is None:
+            self.key_index = dict()
+            for anno in self.annotations:
+                self.key_index.setdefault(anno.key, list()).append(anno)
+        return self.key_index
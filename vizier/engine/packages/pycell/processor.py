@@ -18,6 +18,7 @@
 
 from typing import cast, List, Tuple, TextIO, Any, Dict
 import sys
+import logging
 import requests
 import os
 
@@ -41,6 +42,8 @@ VARS_OPEN = 'open'
 SANDBOX_PYTHON_EXECUTION = os.environ.get('SANDBOX_PYTHON_EXECUTION', "False")
 SANDBOX_PYTHON_URL = os.environ.get('SANDBOX_PYTHON_URL', 'http://127.0.0.1:5005/')
 
+logger = logging.getLogger(__name__)
+
 class PyCellTaskProcessor(TaskProcessor):
     """Implementation of the task processor for the Python cell package."""
     def compute(self, command_id, arguments, context):
@@ -231,9 +234,11 @@ class PyCellTaskProcessor(TaskProcessor):
                         write[name] = write_descriptor
                 else:
                     raise RuntimeError('Unknown write artifact {}'.format(name))
-            print("Pycell Execution Finished")
-            print("     read: {}".format(read))
-            print("     write: {}".format(write))
+            logger.debug(
+                'Pycell execution finished (read: %s, write: %s)',
+                read,
+                write
+            )
             provenance = ModuleProvenance(
                 read=read,
                 write=write,
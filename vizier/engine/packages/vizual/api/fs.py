@@ -723,11 +723,13 @@ class DefaultVizualApi(VizualApi):
             raise ValueError('unknown column identifier \'' + str(column_id) + '\'')
         # Update the specified cell in the given data array
         rows = dataset.fetch_rows()
-        row_index = -1
-        for i in range(len(rows)):
-            if int(rows[i].identifier) == int(row_id):
-                row_index = i
-                break
+        # Rows are not ordered by their identifier (e.g., after sorting the
+        # dataset). Convert the requested identifier only once for the scan.
+        rid = int(row_id)
+        row_index = next(
+            (i for i, row in enumerate(rows) if int(row.identifier) == rid),
+            -1
+        )
         # Make sure that row refers a valid row in the dataset
         if row_index < 0:
             raise ValueError('invalid row identifier \'' + str(row_id) + '\'')
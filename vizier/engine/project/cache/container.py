@@ -19,6 +19,7 @@ container.
 """
 
 import docker # type: ignore[import]
+import os
 from typing import cast, List, Dict, Any
 import requests
 
@@ -162,10 +163,11 @@ class ContainerProjectCache(ProjectCache):
         self.client = docker.from_env()
         # Read mapping of project identifier to container information
         self.store = DefaultObjectStore()
-        containers = dict()
+        containers: Dict[str, Dict[str, Any]] = dict()
         if self.store.exists(self.container_file):
-            for obj in cast(List[Dict[str, Any]], self.store.read_object(self.container_file)):
-                containers[obj['projectId']] = obj
+            containers = {
+                obj['projectId']: obj for obj in self.read_container_info()
+            }
         # Create index of project handles from existing viztrails. The project
         # handles do not have a reference to the datastore or filestore.
         self.projects = dict()
@@ -200,7 +202,7 @@ class ContainerProjectCache(ProjectCache):
         viztrail = self.viztrails.create_viztrail(properties=properties)
         # Start a new docker container for the project on the next unused
         # port. Raises ValueError if all given port numbers are currently used.
-        used_ports = [p.port for p in list(self.projects.values())]
+        used_ports = {p.port for p in self.projects.values()}
         port = None
         for port_nr in self.ports:
             if not port_nr in used_ports:
@@ -312,16 +314,52 @@ class ContainerProjectCache(ProjectCache):
         """
         return list(self.projects.values())
 
+    @property
+    def pickle_file(self) -> str:
+        """Path to the pickled copy of the container information file.
+
+        Returns
+        -------
+        string
+        """
+        return self.container_file + '.pkl'
+
+    def read_container_info(self) -> List[Dict[str, Any]]:
+        """Read the mapping of project identifier to project containers. Reads
+        the pickled copy of the container file if it exists and is not older
+        than the Json file. Otherwise, the Json file is read.
+
+        Returns
+        -------
+        list(dict)
+        """
+        pickle_file = self.pickle_file
+        if self.store.exists(pickle_file):
+            json_mtime = os.stat(self.container_file).st_mtime_ns
+            if os.stat(pickle_file).st_mtime_ns >= json_mtime:
+                return self.store.read_pickle(pickle_file)
+        return cast(
+            List[Dict[str, Any]],
+            self.store.read_object(self.container_file)
+        )
+
     def write_container_info(self):
         """Write the current mapping of project identifier to project containers
-        to the object store container file.
+        to the object store container file. The Json file remains the main
+        representation of the information. A pickled copy is written for faster
+        loading.
         """
+        content = [{
+            'projectId': p.identifier,
+            'containerId': p.container_id,
+            'port': p.port,
+            'url': p.container_api
+        } for p in list(self.projects.values())]
         self.store.write_object(
-            content=[{
-                'projectId': p.identifier,
-                'containerId': p.container_id,
-                'port': p.port,
-                'url': p.container_api
-            } for p in list(self.projects.values())],
+            content=content,
             object_path=self.container_file
         )
+        self.store.write_pickle(
+            content=content,
+            object_path=self.pickle_file
+        )
@@ -23,7 +23,8 @@ the resources as documents in a document store.
 """
 
 import os
-from typing import cast, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast, Optional, Dict, Any, List
 
 from vizier.core.io.base import DefaultObjectStore
 from vizier.viztrail.objectstore.viztrail import OSViztrailHandle
@@ -33,6 +34,9 @@ from vizier.core.io.base import ObjectStore
 """Resource identifier"""
 OBJ_VIZTRAILINDEX = 'viztrails'
 
+"""Maximum number of viztrails that are loaded concurrently."""
+MAX_LOAD_WORKERS = 32
+
 
 class OSViztrailRepository(ViztrailRepository):
     """Repository for viztrails. This implementation maintains all resources
@@ -78,12 +82,15 @@ class OSViztrailRepository(ViztrailRepository):
         else:
             self.object_store = DefaultObjectStore()
         # Initialize the viztrails index. Create the index file if it does not
-        # exist.
+        # exist. There is no need to read a newly created (empty) index.
         self.viztrails_index = self.object_store.join(
             self.base_path,
             OBJ_VIZTRAILINDEX
         )
-        if not self.object_store.exists(self.viztrails_index):
+        identifiers: List[str] = list()
+        if self.object_store.exists(self.viztrails_index):
+            identifiers = list(cast(Dict[str, Any], self.object_store.read_object(self.viztrails_index)))
+        else:
             self.object_store.create_object(
                 parent_folder=self.base_path,
                 identifier=OBJ_VIZTRAILINDEX,
@@ -92,15 +99,17 @@ class OSViztrailRepository(ViztrailRepository):
         # Load viztrails and intialize the remaining instance variables by
         # calling the constructor of the super class
         self.viztrails: Dict[str, OSViztrailHandle] = dict()
-        for identifier in cast(Dict[str, Any], self.object_store.read_object(self.viztrails_index)):
-            vt = OSViztrailHandle.load_viztrail(
-                base_path=self.object_store.join(self.base_path, identifier),
-                object_store=self.object_store
-            )
-            # We just got the identifier from the repository... the loaded
-            # viztrail had better exist.
-            assert vt is not None
-            self.viztrails[vt.identifier] = vt
+        if identifiers:
+            # Loading a viztrail is dominated by object store reads. Load all
+            # viztrails concurrently.
+            workers = min(len(identifiers), MAX_LOAD_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                viztrails = list(executor.map(self.load_viztrail, identifiers))
+            for vt in viztrails:
+                # We just got the identifier from the repository... the loaded
+                # viztrail had better exist.
+                assert vt is not None
+                self.viztrails[vt.identifier] = vt
 
     def create_viztrail(self, 
             properties: Optional[Dict[str, Any]] = None
@@ -134,7 +143,7 @@ class OSViztrailRepository(ViztrailRepository):
         self.viztrails[vt.identifier] = vt
         self.object_store.write_object(
             object_path=self.viztrails_index,
-            content=[vt_id for vt_id in self.viztrails]
+            content=list(self.viztrails)
         )
         return vt
 
@@ -161,7 +170,7 @@ class OSViztrailRepository(ViztrailRepository):
             del self.viztrails[viztrail_id]
             self.object_store.write_object(
                 object_path=self.viztrails_index,
-                content=[vt for vt in self.viztrails]
+                content=list(self.viztrails)
             )
             return True
         else:
@@ -193,3 +202,20 @@ class OSViztrailRepository(ViztrailRepository):
         list(vizier.viztrail.base.ViztrailHandle)
         """
         return list(self.viztrails.values())
+
+    def load_viztrail(self, identifier: str) -> Optional[OSViztrailHandle]:
+        """Load the viztrail with the given identifier from the object store.
+
+        Parameters
+        ----------
+        identifier: string
+            Unique viztrail identifier
+
+        Returns
+        -------
+        vizier.viztrail.objectstore.viztrail.OSViztrailHandle
+        """
+        return OSViztrailHandle.load_viztrail(
+            base_path=self.object_store.join(self.base_path, identifier),
+            object_store=self.object_store
+        )